@@ -1,7 +1,8 @@
-import pandas as pd
-import re
 from pathlib import Path
 
+from excel_markdown import OUTPUT_BUFFER_SIZE, make_safe_filename, write_sheet_file
+from excel_sheets import SUPPORTED_SUFFIXES, iter_converted_sheets
+
 INPUT_FILE = "examples/genexus.xlsx" 
 
 OUTPUT_FILE = None
@@ -13,65 +14,21 @@ CLEAN_MODE = 'auto'
 ENABLE_PAGINATION = True
 OUTPUT_FOLDER = "output"
 
+# Parallel sheet conversion: number of worker processes
+# (None = one per CPU, 1 = convert sheets in this process)
+MAX_WORKERS = None
+
 SKIP_EMPTY_ROWS = True
 SKIP_UNNAMED_COLS = True
 
-def clean_dataframe(df, mode='auto'):
-    """
-    Clean dataframe by removing NaN and unnamed columns
-    
-    Args:
-        df: pandas DataFrame
-        mode: cleaning mode
-    
-    Returns:
-        Cleaned DataFrame
-    """
-    if mode == 'none':
-        return df
-    
-    # Remove completely empty rows
-    df = df.dropna(how='all')
-    
-    # Remove completely empty columns
-    df = df.dropna(axis=1, how='all')
-    
-    if mode in ['auto', 'aggressive']:
-        # Remove columns with Unnamed pattern
-        unnamed_pattern = re.compile(r'^Unnamed:')
-        cols_to_keep = []
-        for col in df.columns:
-            if not unnamed_pattern.match(str(col)):
-                cols_to_keep.append(col)
-            else:
-                # Check if this unnamed column has meaningful data
-                non_null_count = df[col].notna().sum()
-                if non_null_count > len(df) * 0.5:  # More than 50% non-null
-                    cols_to_keep.append(col)
-        
-        if cols_to_keep:
-            df = df[cols_to_keep]
-        
-        # Replace NaN with empty string
-        df = df.fillna('')
-        
-        # Remove rows where all values are empty strings
-        df = df.loc[~(df == '').all(axis=1)]
-    
-    if mode == 'aggressive':
-        # Remove sparse rows (rows with too many empty cells)
-        threshold = min(3, len(df.columns) * 0.3)
-        df = df.loc[df.apply(lambda x: (x != '').sum() >= threshold, axis=1)]
-    
-    return df
-
 
 def convert_excel_to_markdown(
     input_file: str,
     output_file: str = None,
     clean_mode: str = 'auto',
     enable_pagination: bool = False,
-    output_folder: str = "output"
+    output_folder: str = "output",
+    max_workers: int = None
 ):
     """
     Convert Excel file to Markdown format
@@ -82,13 +39,14 @@ def convert_excel_to_markdown(
         clean_mode: Cleaning mode
         enable_pagination: Save each sheet to a separate .md file
         output_folder: Folder for paginated output files
+        max_workers: Worker processes for sheet conversion (None = one per CPU)
     """
     # Validate input file
     input_path = Path(input_file)
     if not input_path.exists():
         raise FileNotFoundError(f"Input file not found: {input_file}")
     
-    if input_path.suffix.lower() not in ['.xlsx', '.xls']:
+    if input_path.suffix.lower() not in SUPPORTED_SUFFIXES:
         raise ValueError(f"Unsupported file format: {input_path.suffix}")
     
     print(f"Converting: {input_path}")
@@ -111,49 +69,26 @@ def convert_excel_to_markdown(
     print()
     
     try:
-        # Read all sheets
-        excel_file = pd.ExcelFile(input_path)
+        sheets = iter_converted_sheets(input_path, clean_mode, max_workers=max_workers)
         
         if enable_pagination:
             # Pagination mode: save each sheet to separate file
             output_files = []
             
-            for sheet_name in excel_file.sheet_names:
+            for sheet_name, markdown_table in sheets:
                 print(f"Processing sheet: {sheet_name}")
                 
-                # Read sheet without header
-                df = pd.read_excel(input_path, sheet_name=sheet_name, header=None)
-                
-                # Clean dataframe
-                df = clean_dataframe(df, mode=clean_mode)
-                
                 # Skip if empty after cleaning
-                if df.empty:
+                if markdown_table is None:
                     print(f"  → Skipped (empty after cleaning)")
                     continue
                 
                 # Create safe filename from sheet name
-                safe_filename = "".join(c if c.isalnum() or c in (' ', '-', '_') else '_' for c in sheet_name)
-                safe_filename = safe_filename.strip().replace(' ', '_')
+                safe_filename = make_safe_filename(sheet_name)
                 sheet_output_path = output_dir / f"{safe_filename}.md"
                 
-                # Build markdown content
-                markdown_content = []
-                markdown_content.append(f"# {sheet_name}\n")
-                
-                # Use first row as header if it looks like a header
-                first_row = df.iloc[0]
-                if all(isinstance(val, str) or val != '' for val in first_row):
-                    df.columns = first_row
-                    df = df.iloc[1:]
-                
-                # Convert to markdown table
-                markdown_table = df.to_markdown(index=False)
-                markdown_content.append(markdown_table)
-                
                 # Write to individual file
-                final_content = '\n'.join(markdown_content)
-                sheet_output_path.write_text(final_content, encoding='utf-8')
+                write_sheet_file(sheet_output_path, sheet_name, markdown_table)
                 output_files.append(sheet_output_path)
                 
                 print(f"  → Saved to: {sheet_output_path.name}")
@@ -163,42 +98,27 @@ def convert_excel_to_markdown(
             print(f"Created {len(output_files)} files in: {output_dir}")
             
         else:
-            # Single file mode: combine all sheets
-            markdown_content = []
-            
-            for sheet_name in excel_file.sheet_names:
-                print(f"Processing sheet: {sheet_name}")
-                
-                # Read sheet without header
-                df = pd.read_excel(input_path, sheet_name=sheet_name, header=None)
-                
-                # Clean dataframe
-                df = clean_dataframe(df, mode=clean_mode)
-                
-                # Skip if empty after cleaning
-                if df.empty:
-                    print(f"  → Skipped (empty after cleaning)")
-                    continue
-                
-                # Add sheet name as header
-                markdown_content.append(f"## {sheet_name}\n")
-                
-                # Use first row as header if it looks like a header
-                first_row = df.iloc[0]
-                if all(isinstance(val, str) or val != '' for val in first_row):
-                    df.columns = first_row
-                    df = df.iloc[1:]
-                
-                # Convert to markdown table
-                markdown_table = df.to_markdown(index=False)
-                markdown_content.append(markdown_table)
-                markdown_content.append("\n")
-                
-                print(f"  → Converted successfully")
-            
-            # Write to single file
-            final_content = '\n'.join(markdown_content)
-            output_path.write_text(final_content, encoding='utf-8')
+            # Single file mode: stream all sheets into one file
+            with open(output_path, 'wb', buffering=OUTPUT_BUFFER_SIZE) as f:
+                sheets_written = 0
+                
+                for sheet_name, markdown_table in sheets:
+                    print(f"Processing sheet: {sheet_name}")
+                    
+                    # Skip if empty after cleaning
+                    if markdown_table is None:
+                        print(f"  → Skipped (empty after cleaning)")
+                        continue
+                    
+                    # Add sheet name as header
+                    if sheets_written:
+                        f.write(b"\n")
+                    f.write(f"## {sheet_name}\n\n".encode('utf-8'))
+                    f.write(markdown_table.encode('utf-8'))
+                    f.write(b"\n\n")
+                    sheets_written += 1
+                    
+                    print(f"  → Converted successfully")
             
             print()
             print("✅ Conversion completed!")
@@ -221,7 +141,8 @@ def main():
         output_file=OUTPUT_FILE,
         clean_mode=CLEAN_MODE,
         enable_pagination=ENABLE_PAGINATION,
-        output_folder=OUTPUT_FOLDER
+        output_folder=OUTPUT_FOLDER,
+        max_workers=MAX_WORKERS
     )
 
 
@@ -1,7 +1,15 @@
-from markitdown import MarkItDown
 from pathlib import Path
-import re
-import pandas as pd
+
+from python_calamine import CalamineWorkbook
+
+from excel_clean import clean_dataframe
+from excel_markdown import (
+    OUTPUT_BUFFER_SIZE,
+    dataframe_to_markdown,
+    make_safe_filename,
+    write_sheet_file,
+)
+from excel_sheets import SUPPORTED_SUFFIXES, iter_converted_sheets
 
 INPUT_FILE = "examples/genexus.xlsx" 
 
@@ -11,92 +19,47 @@ OUTPUT_FILE = None
 ENABLE_PAGINATION = True
 OUTPUT_FOLDER = "output"
 
-ENABLE_PLUGINS = False  # Enable plugins if needed
+# Worker processes for sheet conversion (None = one per CPU, 1 = disabled)
+MAX_WORKERS = None
 
 # Clean mode: 'auto', 'aggressive', 'minimal', 'none'
 CLEAN_MODE = 'auto' 
 
-def clean_dataframe(df, mode='auto'):
-    """
-    Clean dataframe by removing NaN and unnamed columns
-    Same logic as convert.py for consistency
-    
-    Args:
-        df: pandas DataFrame
-        mode: cleaning mode ('auto', 'aggressive', 'minimal', 'none')
-    
-    Returns:
-        Cleaned DataFrame
-    """
-    if mode == 'none':
-        return df
-    
-    # Remove completely empty rows
-    df = df.dropna(how='all')
-    
-    # Remove completely empty columns
-    df = df.dropna(axis=1, how='all')
-    
-    if mode in ['auto', 'aggressive']:
-        # Remove columns with Unnamed pattern
-        unnamed_pattern = re.compile(r'^Unnamed:')
-        cols_to_keep = []
-        for col in df.columns:
-            if not unnamed_pattern.match(str(col)):
-                cols_to_keep.append(col)
-            else:
-                # Check if this unnamed column has meaningful data
-                non_null_count = df[col].notna().sum()
-                if non_null_count > len(df) * 0.5:  # More than 50% non-null
-                    cols_to_keep.append(col)
-        
-        if cols_to_keep:
-            df = df[cols_to_keep]
-        
-        # Replace NaN with empty string
-        df = df.fillna('')
-        
-        # Remove rows where all values are empty strings
-        df = df.loc[~(df == '').all(axis=1)]
-    
-    if mode == 'aggressive':
-        # Remove sparse rows (rows with too many empty cells)
-        threshold = min(3, len(df.columns) * 0.3)
-        df = df.loc[df.apply(lambda x: (x != '').sum() >= threshold, axis=1)]
-    
-    return df
 
-
-def process_sheet_with_pandas(input_file: str, sheet_name: str, clean_mode: str) -> str:
+def process_sheet_with_pandas(excel_file, sheet_name: str, clean_mode: str) -> str:
     """
     Process single Excel sheet using pandas for cleaning
     
     Args:
-        input_file: Path to Excel file
+        excel_file: Excel file opened with excel_sheets.open_excel_file
         sheet_name: Name of the sheet
         clean_mode: Cleaning mode
     
     Returns:
         Cleaned markdown content
     """
+    import pandas as pd
+    
+    # Calamine workbooks are opened without pandas, wrap them to parse
+    if isinstance(excel_file, CalamineWorkbook):
+        excel_file = pd.ExcelFile(excel_file, engine='calamine')
+    
     # Read sheet without header
-    df = pd.read_excel(input_file, sheet_name=sheet_name, header=None)
+    df = excel_file.parse(sheet_name=sheet_name, header=None)
     
-    # Clean dataframe using the same logic as convert.py
+    # Clean dataframe
     df = clean_dataframe(df, mode=clean_mode)
     
     # Skip if empty after cleaning
     if df.empty:
         return None
     
-    # Use first row as header if it looks like a header
-    first_row = df.iloc[0]
-    if all(isinstance(val, str) or val != '' for val in first_row):
-        df.columns = first_row
-        df = df.iloc[1:]
+    # Use first row as header
+    df.columns = df.iloc[0]
+    df = df.iloc[1:]
     
     # Convert to markdown table
-    markdown_table = df.to_markdown(index=False)
+    markdown_table = dataframe_to_markdown(df)
     
     return markdown_table
 
@@ -104,24 +67,24 @@ def process_sheet_with_pandas(input_file: str, sheet_name: str, clean_mode: str)
 def convert_excel_to_markdown_single_file(
     input_file: str,
     output_file: str = None,
-    enable_plugins: bool = False,
-    clean_mode: str = 'auto'
+    clean_mode: str = 'auto',
+    max_workers: int = None
 ):
     """
-    Convert Excel file to a single Markdown file using MarkItDown
+    Convert Excel file to a single Markdown file using pandas
     
     Args:
         input_file: Path to input Excel file
         output_file: Path to output Markdown file (optional)
-        enable_plugins: Enable MarkItDown plugins
         clean_mode: Cleaning mode for output
+        max_workers: Worker processes for sheet conversion (None = one per CPU)
     """
     input_path = Path(input_file)
     
     if not input_path.exists():
         raise FileNotFoundError(f"Input file not found: {input_file}")
     
-    if input_path.suffix.lower() not in ['.xlsx', '.xls']:
+    if input_path.suffix.lower() not in SUPPORTED_SUFFIXES:
         raise ValueError(f"Unsupported file format: {input_path.suffix}")
     
     # Set output path
@@ -136,27 +99,31 @@ def convert_excel_to_markdown_single_file(
     print()
     
     try:
-        # Read all sheets for processing
-        excel_file = pd.ExcelFile(input_path)
-        markdown_content = []
+        # Process sheets with pandas, in parallel worker processes
+        sheets = iter_converted_sheets(
+            input_path,
+            clean_mode,
+            max_workers=max_workers,
+            sheet_converter=process_sheet_with_pandas
+        )
         
         print("Processing with pandas and clean logic...")
         
-        for sheet_name in excel_file.sheet_names:
-            print(f"  Processing sheet: {sheet_name}")
+        # Stream each sheet straight into the output file
+        with open(output_path, 'wb', buffering=OUTPUT_BUFFER_SIZE) as f:
+            sheets_written = 0
             
-            # Process sheet with pandas
-            sheet_markdown = process_sheet_with_pandas(str(input_path), sheet_name, clean_mode)
-            
-            if sheet_markdown:
-                # Add sheet name as header
-                markdown_content.append(f"## {sheet_name}\n")
-                markdown_content.append(sheet_markdown)
-                markdown_content.append("\n")
-        
-        # Write to file
-        final_content = '\n'.join(markdown_content)
-        output_path.write_text(final_content, encoding='utf-8')
+            for sheet_name, sheet_markdown in sheets:
+                print(f"  Processing sheet: {sheet_name}")
+                
+                if sheet_markdown:
+                    # Add sheet name as header
+                    if sheets_written:
+                        f.write(b"\n")
+                    f.write(f"## {sheet_name}\n\n".encode('utf-8'))
+                    f.write(sheet_markdown.encode('utf-8'))
+                    f.write(b"\n\n")
+                    sheets_written += 1
         
         print()
         print("✅ Conversion completed!")
@@ -170,27 +137,24 @@ def convert_excel_to_markdown_single_file(
 def convert_excel_to_markdown_paginated(
     input_file: str,
     output_folder: str = "output",
-    enable_plugins: bool = False,
-    clean_mode: str = 'auto'
+    clean_mode: str = 'auto',
+    max_workers: int = None
 ):
     """
-    Convert Excel file to separate Markdown files (one per sheet) using MarkItDown
-    
-    Note: MarkItDown converts the entire Excel file to a single markdown output.
-    This function will parse the output and split it by sheet headings.
+    Convert Excel file to separate Markdown files (one per sheet) using pandas
     
     Args:
         input_file: Path to input Excel file
         output_folder: Folder for output files
-        enable_plugins: Enable MarkItDown plugins
         clean_mode: Cleaning mode for output
+        max_workers: Worker processes for sheet conversion (None = one per CPU)
     """
     input_path = Path(input_file)
     
     if not input_path.exists():
         raise FileNotFoundError(f"Input file not found: {input_file}")
     
-    if input_path.suffix.lower() not in ['.xlsx', '.xls']:
+    if input_path.suffix.lower() not in SUPPORTED_SUFFIXES:
         raise ValueError(f"Unsupported file format: {input_path.suffix}")
     
     # Create output folder
@@ -204,38 +168,30 @@ def convert_excel_to_markdown_paginated(
     print()
     
     try:
-        # Read all sheets for processing
-        excel_file = pd.ExcelFile(input_path)
+        # Process sheets with pandas, in parallel worker processes
+        sheets = iter_converted_sheets(
+            input_path,
+            clean_mode,
+            max_workers=max_workers,
+            sheet_converter=process_sheet_with_pandas
+        )
         output_files = []
         
         print("Processing with pandas and clean logic...")
         
-        for sheet_name in excel_file.sheet_names:
+        for sheet_name, sheet_markdown in sheets:
             print(f"  Processing sheet: {sheet_name}")
             
-            # Process sheet with pandas
-            sheet_markdown = process_sheet_with_pandas(str(input_path), sheet_name, clean_mode)
-            
             if sheet_markdown is None:
                 print(f"    → Skipped (empty after cleaning)")
                 continue
             
             # Create safe filename from sheet name
-            safe_filename = "".join(
-                c if c.isalnum() or c in (' ', '-', '_') else '_' 
-                for c in sheet_name
-            )
-            safe_filename = safe_filename.strip().replace(' ', '_')
-            
-            # Build markdown content with sheet title
-            markdown_content = []
-            markdown_content.append(f"# {sheet_name}\n")
-            markdown_content.append(sheet_markdown)
+            safe_filename = make_safe_filename(sheet_name)
             
-            # Save to file
+            # Save to file with sheet title
             sheet_output_path = output_dir / f"{safe_filename}.md"
-            final_content = '\n'.join(markdown_content)
-            sheet_output_path.write_text(final_content, encoding='utf-8')
+            write_sheet_file(sheet_output_path, sheet_name, sheet_markdown)
             output_files.append(sheet_output_path)
             
             print(f"    → Saved to: {sheet_output_path.name}")
@@ -254,40 +210,40 @@ def convert_excel_to_markdown(
     output_file: str = None,
     enable_pagination: bool = False,
     output_folder: str = "output",
-    enable_plugins: bool = False,
-    clean_mode: str = 'auto'
+    clean_mode: str = 'auto',
+    max_workers: int = None
 ):
     """
-    Convert Excel file to Markdown using MarkItDown
+    Convert Excel file to Markdown using pandas
     
     Args:
         input_file: Path to input Excel file
         output_file: Path to output Markdown file (optional, ignored if enable_pagination=True)
         enable_pagination: Save each sheet to a separate .md file
         output_folder: Folder for paginated output files
-        enable_plugins: Enable MarkItDown plugins
         clean_mode: Cleaning mode
+        max_workers: Worker processes for sheet conversion (None = one per CPU)
     """
     if enable_pagination:
         convert_excel_to_markdown_paginated(
             input_file=input_file,
             output_folder=output_folder,
-            enable_plugins=enable_plugins,
-            clean_mode=clean_mode
+            clean_mode=clean_mode,
+            max_workers=max_workers
         )
     else:
         convert_excel_to_markdown_single_file(
             input_file=input_file,
             output_file=output_file,
-            enable_plugins=enable_plugins,
-            clean_mode=clean_mode
+            clean_mode=clean_mode,
+            max_workers=max_workers
         )
 
 
 def main():
     """Main function"""
     print("=" * 70)
-    print("Excel to Markdown Converter (MarkItDown)")
+    print("Excel to Markdown Converter (pandas)")
     print("=" * 70)
     print()
     
@@ -296,8 +252,8 @@ def main():
         output_file=OUTPUT_FILE,
         enable_pagination=ENABLE_PAGINATION,
         output_folder=OUTPUT_FOLDER,
-        enable_plugins=ENABLE_PLUGINS,
-        clean_mode=CLEAN_MODE
+        clean_mode=CLEAN_MODE,
+        max_workers=MAX_WORKERS
     )
 
 
@@ -0,0 +1,101 @@
+"""
+Sheet cleaning shared by the Excel to Markdown converters
+"""
+
+# Column label prefix pandas gives to headerless columns
+UNNAMED_PREFIX = 'Unnamed:'
+
+
+def clean_dataframe(df, mode='auto'):
+    """
+    Clean dataframe by removing NaN and unnamed columns
+    
+    Args:
+        df: pandas DataFrame
+        mode: cleaning mode
+    
+    Returns:
+        Cleaned DataFrame
+    """
+    if mode == 'none':
+        return df
+    
+    # Build keep masks over the cell array in one pass and slice it once at
+    # the end, instead of a new DataFrame for every cleaning step
+    na = df.isna().to_numpy(dtype=bool)
+    
+    # Remove completely empty rows and columns
+    rows_to_keep = ~na.all(axis=1)
+    cols_to_keep = ~na.all(axis=0)
+    
+    if mode not in ['auto', 'aggressive']:
+        return df.iloc[rows_to_keep, cols_to_keep]
+    
+    # Remove columns with Unnamed pattern, unless they have meaningful
+    # data (more than 50% non-null)
+    is_unnamed = df.columns.astype(str).str.startswith(UNNAMED_PREFIX)
+    has_data = (~na).sum(axis=0) > rows_to_keep.sum() * 0.5
+    named_or_data = cols_to_keep & (~is_unnamed | has_data)
+    
+    if named_or_data.any():
+        cols_to_keep = named_or_data
+    
+    # Replace NaN with empty string
+    values = df.to_numpy(dtype=object, na_value='')
+    
+    # Remove rows where all values are empty strings
+    filled_counts = (values[:, cols_to_keep] != '').sum(axis=1)
+    rows_to_keep &= filled_counts > 0
+    
+    if mode == 'aggressive':
+        # Remove sparse rows (rows with too many empty cells)
+        threshold = min(3, cols_to_keep.sum() * 0.3)
+        rows_to_keep &= filled_counts >= threshold
+    
+    import pandas as pd
+    return pd.DataFrame(
+        values[rows_to_keep][:, cols_to_keep],
+        index=df.index[rows_to_keep],
+        columns=df.columns[cols_to_keep]
+    )
+
+
+def clean_rows(rows, mode='auto'):
+    """
+    Clean raw sheet rows, same rules as clean_dataframe
+    
+    Empty cells are '' or None. Rows have no column labels, so there
+    are no Unnamed columns to drop.
+    
+    Args:
+        rows: List of row value lists, all the same length
+        mode: cleaning mode
+    
+    Returns:
+        Cleaned rows
+    """
+    if mode == 'none':
+        return rows
+    
+    # Remove completely empty rows
+    rows = [row for row in rows if row.count('') + row.count(None) < len(row)]
+    if not rows:
+        return rows
+    
+    # Remove completely empty columns
+    cols_to_keep = [
+        i for i, col in enumerate(zip(*rows))
+        if col.count('') + col.count(None) < len(col)
+    ]
+    if len(cols_to_keep) < len(rows[0]):
+        rows = [[row[i] for i in cols_to_keep] for row in rows]
+    
+    if mode == 'aggressive':
+        # Remove sparse rows (rows with too many empty cells)
+        threshold = min(3, len(cols_to_keep) * 0.3)
+        rows = [
+            row for row in rows
+            if len(row) - row.count('') - row.count(None) >= threshold
+        ]
+    
+    return rows
@@ -0,0 +1,113 @@
+"""
+Filename and markdown helpers shared by the Excel converters
+"""
+
+import re
+from pathlib import Path
+
+# Write buffer for streamed markdown output
+OUTPUT_BUFFER_SIZE = 1 << 20
+
+# Anything that isn't alphanumeric, space, dash or underscore in a sheet name
+UNSAFE_FILENAME_CHARS = re.compile(r'[^\w\- ]')
+
+def make_safe_filename(sheet_name: str) -> str:
+    """
+    Create safe filename from sheet name
+    
+    Args:
+        sheet_name: Name of the sheet
+    
+    Returns:
+        Filename stem with unsafe characters and spaces replaced by '_'
+    """
+    return UNSAFE_FILENAME_CHARS.sub('_', sheet_name).strip().replace(' ', '_')
+
+
+def escape_markdown_text(text: str) -> str:
+    """
+    Escape text so it stays inside one markdown table cell
+    
+    Args:
+        text: Cell text
+    
+    Returns:
+        Text with pipes escaped and line breaks removed
+    """
+    # Most cells need no escaping. Checking first is far cheaper than
+    # str.translate, which is slow with multi-character replacements
+    if '|' in text or '\n' in text or '\r' in text:
+        text = text.replace('|', '\\|').replace('\n', ' ').replace('\r', '')
+    return text
+
+
+def format_markdown_cell(value) -> str:
+    """
+    Format a single value as markdown table cell text
+    
+    Args:
+        value: Cell value
+    
+    Returns:
+        Escaped cell text
+    """
+    # Most cells are text, check for it before anything else
+    if type(value) is str:
+        return escape_markdown_text(value)
+    if value is None:
+        return ''
+    if isinstance(value, float):
+        if value != value:  # NaN
+            return ''
+        if value.is_integer():
+            value = int(value)
+    return escape_markdown_text(str(value))
+
+
+def rows_to_markdown(header, rows) -> str:
+    """
+    Render rows as a pipe-delimited markdown table
+    
+    Columns are not padded to equal width like df.to_markdown() does,
+    markdown renders the same without it and it is most of tabulate's cost.
+    
+    Args:
+        header: Column labels
+        rows: List of row value lists
+    
+    Returns:
+        Markdown table
+    """
+    header = [format_markdown_cell(col) for col in header]
+    lines = ["| " + " | ".join(header) + " |", "|" + "---|" * len(header)]
+    for row in rows:
+        lines.append("| " + " | ".join(map(format_markdown_cell, row)) + " |")
+    return "\n".join(lines)
+
+
+def dataframe_to_markdown(df) -> str:
+    """
+    Render dataframe as a pipe-delimited markdown table
+    
+    Args:
+        df: pandas DataFrame
+    
+    Returns:
+        Markdown table
+    """
+    return rows_to_markdown(df.columns, df.to_numpy(dtype=object).tolist())
+
+
+def write_sheet_file(output_path: Path, sheet_name: str, markdown_table: str):
+    """
+    Write a single sheet's markdown to its own file
+    
+    Args:
+        output_path: Path to output Markdown file
+        sheet_name: Name of the sheet, used as the title
+        markdown_table: Markdown table of the sheet
+    """
+    # Encode each part once and write the bytes straight through, no joined copy
+    with open(output_path, 'wb', buffering=OUTPUT_BUFFER_SIZE) as f:
+        f.write(f"# {sheet_name}\n\n".encode('utf-8'))
+        f.write(markdown_table.encode('utf-8'))
@@ -0,0 +1,192 @@
+"""
+Sheet reading shared by the Excel to Markdown converters
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from python_calamine import CalamineWorkbook, SheetTypeEnum
+
+from excel_clean import clean_dataframe, clean_rows
+from excel_markdown import dataframe_to_markdown, rows_to_markdown
+
+SUPPORTED_SUFFIXES = ['.xlsx', '.xlsm', '.xls']
+
+# Below this many used cells in total, converting every sheet in this process
+# is faster than starting workers, which spawn and import their readers first
+MIN_PARALLEL_CELLS = 200_000
+
+# openpyxl fallback: stream cells instead of building the full workbook tree
+OPENPYXL_ENGINE_KWARGS = {'read_only': True, 'data_only': True, 'keep_links': False}
+
+
+def get_excel_engine(input_path: Path) -> str:
+    """
+    Pick the reader engine for an Excel file
+    
+    Args:
+        input_path: Path to the Excel file
+    
+    Returns:
+        Engine name, 'calamine' or 'openpyxl'
+    """
+    # Macro-enabled workbooks stay on openpyxl, everything else uses the
+    # Rust-based calamine reader which is much faster than openpyxl
+    if input_path.suffix.lower() == '.xlsm':
+        return 'openpyxl'
+    return 'calamine'
+
+
+def open_excel_file(input_path: Path):
+    """
+    Open an Excel file with the best available reader engine
+    
+    Args:
+        input_path: Path to the Excel file
+    
+    Returns:
+        CalamineWorkbook, or pandas ExcelFile for the openpyxl fallback
+    """
+    engine = get_excel_engine(input_path)
+    if engine == 'calamine':
+        # Let calamine open the file itself and read only the parts it needs,
+        # its rows are rendered directly without going through pandas
+        return CalamineWorkbook.from_path(str(input_path))
+    
+    # pandas is only needed for the openpyxl fallback, import it lazily
+    import pandas as pd
+    return pd.ExcelFile(input_path, engine=engine, engine_kwargs=OPENPYXL_ENGINE_KWARGS)
+
+
+def count_used_cells(input_path: Path, limit: int = None) -> int:
+    """
+    Count the cells in the used range of every worksheet
+    
+    Args:
+        input_path: Path to the Excel file
+        limit: Stop counting once the total reaches it (None = count all)
+    
+    Returns:
+        Total number of used cells, at least limit when counting stopped early
+    """
+    total = 0
+    # Calamine reads macro-enabled workbooks too, whatever engine converts them
+    with CalamineWorkbook.from_path(str(input_path)) as workbook:
+        for metadata in workbook.sheets_metadata:
+            if metadata.typ != SheetTypeEnum.WorkSheet:
+                continue
+            sheet = workbook.get_sheet_by_name(metadata.name)
+            total += sheet.height * sheet.width
+            if limit is not None and total >= limit:
+                break
+    return total
+
+
+def convert_sheet(excel_file, sheet_name: str, clean_mode: str) -> str:
+    """
+    Read, clean and render a single sheet
+    
+    Args:
+        excel_file: Excel file opened with open_excel_file
+        sheet_name: Name of the sheet
+        clean_mode: Cleaning mode
+    
+    Returns:
+        Markdown table, or None if the sheet is empty after cleaning
+    """
+    if isinstance(excel_file, CalamineWorkbook):
+        # Calamine already gives plain rows, no need for a DataFrame
+        sheet = excel_file.get_sheet_by_name(sheet_name)
+        
+        # Skip sheets with no used range before building any rows
+        if sheet.height == 0 or sheet.width == 0:
+            return None
+        
+        rows = clean_rows(sheet.to_python(skip_empty_area=False), mode=clean_mode)
+        
+        # Skip if empty after cleaning
+        if not rows:
+            return None
+        
+        # Use first row as header
+        return rows_to_markdown(rows[0], rows[1:])
+    
+    # openpyxl fallback: read sheet without header through pandas
+    df = excel_file.parse(sheet_name=sheet_name, header=None)
+    
+    # Clean dataframe
+    df = clean_dataframe(df, mode=clean_mode)
+    
+    # Skip if empty after cleaning
+    if df.empty:
+        return None
+    
+    # Use first row as header
+    df.columns = df.iloc[0]
+    df = df.iloc[1:]
+    
+    # Convert to markdown table
+    return dataframe_to_markdown(df)
+
+
+# Workbook opened once per worker process by _init_sheet_worker
+_worker_excel_file = None
+
+
+def _init_sheet_worker(input_path: Path):
+    """Open the workbook once in each worker process"""
+    global _worker_excel_file
+    _worker_excel_file = open_excel_file(input_path)
+
+
+def _convert_sheet_in_worker(sheet_converter, sheet_name: str, clean_mode: str) -> str:
+    """Convert a sheet with the worker's own workbook"""
+    return sheet_converter(_worker_excel_file, sheet_name, clean_mode)
+
+
+def iter_converted_sheets(
+    input_path: Path,
+    clean_mode: str,
+    max_workers: int = None,
+    sheet_converter=convert_sheet
+):
+    """
+    Convert every sheet of an Excel file to a markdown table
+    
+    Sheets are converted in worker processes when there is more than one
+    worker and at least MIN_PARALLEL_CELLS used cells, each worker opening
+    its own reader. Results come back in workbook order.
+    
+    Args:
+        input_path: Path to the Excel file
+        clean_mode: Cleaning mode
+        max_workers: Number of worker processes (None = one per CPU, 1 = no pool)
+        sheet_converter: Module-level function (excel_file, sheet_name, clean_mode)
+            returning the sheet's markdown table or None
+    
+    Yields:
+        (sheet_name, markdown_table) tuples, markdown_table is None for
+        sheets that are empty after cleaning
+    """
+    with open_excel_file(input_path) as excel_file:
+        sheet_names = excel_file.sheet_names
+        
+        # A single worker, or workers for a small workbook, only add startup time
+        max_workers = min(max_workers or os.cpu_count() or 1, len(sheet_names))
+        if max_workers < 2 or count_used_cells(input_path, MIN_PARALLEL_CELLS) < MIN_PARALLEL_CELLS:
+            for sheet_name in sheet_names:
+                yield sheet_name, sheet_converter(excel_file, sheet_name, clean_mode)
+            return
+    
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_init_sheet_worker,
+        initargs=(input_path,)
+    ) as executor:
+        results = executor.map(
+            _convert_sheet_in_worker,
+            [sheet_converter] * len(sheet_names),
+            sheet_names,
+            [clean_mode] * len(sheet_names)
+        )
+        yield from zip(sheet_names, results)
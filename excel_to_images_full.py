@@ -1,8 +1,41 @@
+import atexit
+import json
+import math
+import multiprocessing
 import os
-import shutil
-import tempfile
+import warnings
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
 
-from excel_processor import Workbook, FileFormat
+from excel_processor import Workbook
+from python_calamine import CalamineWorkbook, SheetTypeEnum
+
+from excel_markdown import UNSAFE_FILENAME_CHARS
+from split_excel_by_sheet import save_sheet_copy
+
+# Below this many used cells in total, rendering every sheet in this process
+# is faster than starting workers (about 1 s each to spawn and load Spire)
+MIN_PARALLEL_CELLS = 5000
+
+# Spire renders only this many leading sheets of a workbook in place,
+# later sheets come out as an evaluation notice page instead
+DIRECT_RENDER_SHEETS = 3
+
+# Spire's used range also covers cells that only carry formatting. When it
+# runs more than this many rows or columns past the last value, it is cut
+# back to the values so long empty formatted tails are not rendered
+MAX_FORMATTED_TAIL = 50
+
+# Largest image to render, in pixels. Spire draws it into a 32-bit bitmap
+# in memory, sheets that would go over 512 MB are rendered at a lower DPI
+MAX_IMAGE_PIXELS = 128 * 1024 * 1024
+
+# Loaded workbooks kept between convert_sheet_to_image calls
+WORKBOOK_CACHE_SIZE = 4
+
+# Records, in the output directory, which workbook and settings wrote each image
+IMAGE_MANIFEST_FILE = ".excel_images.json"
 
 
 def split_excel_by_sheets(input_file, output_dir):
@@ -24,21 +57,307 @@ def split_excel_by_sheets(input_file, output_dir):
     split_files = []
     
     for worksheet in workbook.Worksheets:
-        sheet_name = worksheet.Name
+        split_files.append((worksheet.Name, save_sheet_copy(worksheet, output_dir)))
+    
+    workbook.Dispose()
+    
+    return split_files
+
+
+def probe_sheet_bounds(input_file):
+    """
+    Read the used range of every worksheet without loading the file in Spire
+    
+    Args:
+        input_file: Input Excel file path
+        
+    Returns:
+        Dict of sheet_name -> (first_row, first_column, last_row, last_column)
+        in sheet order, 1-based like Spire, or None for sheets with no cells
+    """
+    bounds = {}
+    
+    with CalamineWorkbook.from_path(str(input_file)) as workbook:
+        for metadata in workbook.sheets_metadata:
+            # Chart sheets are not in Spire's Worksheets either
+            if metadata.typ != SheetTypeEnum.WorkSheet:
+                continue
+            
+            sheet = workbook.get_sheet_by_name(metadata.name)
+            if sheet.start is None:
+                bounds[metadata.name] = None
+            else:
+                (first_row, first_column), (last_row, last_column) = sheet.start, sheet.end
+                bounds[metadata.name] = (first_row + 1, first_column + 1, last_row + 1, last_column + 1)
+    
+    return bounds
+
+
+def set_image_dpi(workbook, dpi):
+    """
+    Apply the image converter DPI settings to a workbook
+    
+    Args:
+        workbook: Workbook to render from
+        dpi: DPI resolution
+    """
+    converterSetting = workbook.ConverterSetting
+    converterSetting.XDpi = dpi
+    converterSetting.YDpi = dpi
+
+
+def load_workbook(input_file, dpi=300):
+    """
+    Load an Excel file to render its sheets
+    
+    Args:
+        input_file: Input Excel file path
+        dpi: DPI resolution (default: 300)
+        
+    Returns:
+        Workbook with the image converter settings applied
+    """
+    workbook = Workbook()
+    workbook.LoadFromFile(input_file)
+    set_image_dpi(workbook, dpi)
+    
+    return workbook
+
+
+def create_render_workbook(dpi=300):
+    """
+    Create an empty workbook that sheets are copied into for rendering
+    
+    Args:
+        dpi: DPI resolution (default: 300)
         
-        newWorkbook = Workbook()
-        newWorkbook.Worksheets.Clear()
-        newWorkbook.Worksheets.AddCopy(worksheet)
+    Returns:
+        Workbook with the image converter settings applied
+    """
+    workbook = Workbook()
+    workbook.Worksheets.Clear()
+    set_image_dpi(workbook, dpi)
+    
+    return workbook
+
+
+def estimate_image_pixels(worksheet, first_row, first_column, last_row, last_column, dpi):
+    """
+    Estimate the size of a worksheet's image before rendering it
+    
+    Args:
+        worksheet: Worksheet to render
+        first_row, first_column, last_row, last_column: Range to render
+        dpi: DPI resolution
         
-        output_file = os.path.join(output_dir, f"{sheet_name}.xlsx")
-        newWorkbook.SaveToFile(output_file, FileFormat.Version2016)
+    Returns:
+        Approximate width * height of the image in pixels
+    """
+    # Rows are counted at the default height, reading every row's height
+    # takes seconds on long sheets while columns are few
+    width = sum(worksheet.GetColumnWidthPixels(column) for column in range(first_column, last_column + 1))
+    height = (last_row - first_row + 1) * worksheet.DefaultRowHeight * 96 / 72
+    return width * height * (dpi / 96) ** 2
+
+
+def render_worksheet(worksheet, output_file, render_workbook, no_margin=True):
+    """
+    Render a worksheet to image, in place or from an in-memory copy
+    
+    Args:
+        worksheet: Worksheet of a Workbook from load_workbook
+        output_file: Output image file path
+        render_workbook: Workbook from create_render_workbook, reused across sheets
+        no_margin: Remove margins from image (default: True)
         
-        split_files.append((sheet_name, output_file))
-        newWorkbook.Dispose()
+    Returns:
+        DPI the image was rendered at, or None for a blank sheet
+    """
+    # Each property read is a call into Spire, read the used range once
+    first_row, first_column = worksheet.FirstRow, worksheet.FirstColumn
+    last_row, last_column = worksheet.LastRow, worksheet.LastColumn
     
-    workbook.Dispose()
+    last_data_row, last_data_column = worksheet.LastDataRow, worksheet.LastDataColumn
+    if last_row - last_data_row > MAX_FORMATTED_TAIL:
+        last_row = last_data_row
+    if last_column - last_data_column > MAX_FORMATTED_TAIL:
+        last_column = last_data_column
     
-    return split_files
+    # Blank sheets have no range left, skip them before copying or rendering
+    if last_row < first_row or last_column < first_column:
+        return None
+    
+    if worksheet.Index < DIRECT_RENDER_SHEETS:
+        sheet = worksheet
+    else:
+        # Render later sheets from a copy as the only sheet of the render workbook
+        render_workbook.Worksheets.Clear()
+        render_workbook.Worksheets.AddCopy(worksheet)
+        sheet = render_workbook.Worksheets.get_Item(0)
+    
+    converterSetting = sheet.Workbook.ConverterSetting
+    requested_dpi = dpi = converterSetting.XDpi
+    if no_margin:
+        page_setup = sheet.PageSetup
+        margins = (page_setup.TopMargin, page_setup.BottomMargin, page_setup.LeftMargin, page_setup.RightMargin)
+    
+    # The workbook may be cached and rendered again, undo the changes below
+    # even when rendering fails
+    try:
+        if no_margin:
+            page_setup.TopMargin = 0
+            page_setup.BottomMargin = 0
+            page_setup.LeftMargin = 0
+            page_setup.RightMargin = 0
+        
+        # Lower the DPI of sheets whose image would not fit in memory
+        pixels = estimate_image_pixels(sheet, first_row, first_column, last_row, last_column, dpi)
+        if pixels > MAX_IMAGE_PIXELS:
+            dpi = int(dpi * math.sqrt(MAX_IMAGE_PIXELS / pixels))
+            converterSetting.XDpi = dpi
+            converterSetting.YDpi = dpi
+        
+        # ToImage returns the PNG already encoded, Save only writes its bytes out
+        image = sheet.ToImage(first_row, first_column, last_row, last_column)
+        
+        image.Save(output_file)
+    finally:
+        # Leave a sheet rendered in place as loaded, it may be rendered again
+        if no_margin and sheet is worksheet:
+            page_setup.TopMargin, page_setup.BottomMargin, page_setup.LeftMargin, page_setup.RightMargin = margins
+        if dpi != requested_dpi:
+            converterSetting.XDpi = requested_dpi
+            converterSetting.YDpi = requested_dpi
+    
+    return dpi
+
+
+# Path -> ((mtime, size), Workbook, dpi), least recently used first
+_workbook_cache = OrderedDict()
+
+
+def get_cached_workbook(input_file, dpi=300):
+    """
+    Load an Excel file, reusing the workbook of an earlier call while the file is unchanged
+    
+    Args:
+        input_file: Input Excel file path
+        dpi: DPI resolution (default: 300)
+        
+    Returns:
+        Workbook with the image converter settings applied, owned by the cache
+    """
+    path = os.path.abspath(input_file)
+    stat = os.stat(path)
+    key = (stat.st_mtime_ns, stat.st_size)
+    
+    entry = _workbook_cache.pop(path, None)
+    if entry is not None and entry[0] != key:
+        entry[1].Dispose()
+        entry = None
+    
+    if entry is None:
+        entry = (key, load_workbook(path, dpi), dpi)
+    elif entry[2] != dpi:
+        # Only touch the converter settings when the DPI changes
+        set_image_dpi(entry[1], dpi)
+        entry = (key, entry[1], dpi)
+    _workbook_cache[path] = entry
+    
+    # Dispose the least recently used workbooks beyond the cache size
+    while len(_workbook_cache) > WORKBOOK_CACHE_SIZE:
+        _, (_, workbook, _) = _workbook_cache.popitem(last=False)
+        workbook.Dispose()
+    
+    return entry[1]
+
+
+def clear_workbook_cache():
+    """Dispose every workbook kept by get_cached_workbook"""
+    while _workbook_cache:
+        _, (_, workbook, _) = _workbook_cache.popitem()
+        workbook.Dispose()
+
+
+atexit.register(clear_workbook_cache)
+
+
+def read_image_manifest(output_dir):
+    """
+    Read the image manifest of an output directory
+    
+    Args:
+        output_dir: Output directory for images
+        
+    Returns:
+        Dict of image file name -> source entry, empty when there is none
+    """
+    try:
+        with open(Path(output_dir) / IMAGE_MANIFEST_FILE, encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return manifest if isinstance(manifest, dict) else {}
+
+
+def write_image_manifest(output_dir, manifest):
+    """
+    Write the image manifest of an output directory
+    
+    Args:
+        output_dir: Output directory for images
+        manifest: Dict of image file name -> source entry
+    """
+    with open(Path(output_dir) / IMAGE_MANIFEST_FILE, 'w', encoding='utf-8') as f:
+        f.write(json.dumps(manifest, indent=2, ensure_ascii=False))
+
+
+def image_source_entry(input_file, dpi, no_margin):
+    """
+    Describe the workbook and settings an image is rendered from
+    
+    Args:
+        input_file: Input Excel file path
+        dpi: DPI resolution
+        no_margin: Whether margins are removed
+        
+    Returns:
+        Manifest entry, equal for images that would render the same
+    """
+    path = os.path.abspath(input_file)
+    stat = os.stat(path)
+    return {
+        "source": path,
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "dpi": dpi,
+        "no_margin": no_margin,
+    }
+
+
+def convert_sheet_to_image(input_file, output_file, sheet, dpi=300, no_margin=True):
+    """
+    Render one sheet of an Excel file to image
+    
+    The loaded file is cached, rendering more sheets of it does not load it again.
+    
+    Args:
+        input_file: Input Excel file path
+        output_file: Output image file path
+        sheet: Worksheet index or name
+        dpi: DPI resolution (default: 300)
+        no_margin: Remove margins from image (default: True)
+        
+    Returns:
+        DPI the image was rendered at, or None for a blank sheet
+    """
+    workbook = get_cached_workbook(input_file, dpi)
+    render_workbook = create_render_workbook(dpi)
+    
+    try:
+        return render_worksheet(workbook.Worksheets.get_Item(sheet), output_file, render_workbook, no_margin)
+    finally:
+        render_workbook.Dispose()
 
 
 def convert_worksheet_to_image_no_margin(excel_file, output_file, sheet_index=0, dpi=300):
@@ -50,29 +369,129 @@ def convert_worksheet_to_image_no_margin(excel_file, output_file, sheet_index=0,
         output_file: Output image file path
         sheet_index: Worksheet index (default: 0)
         dpi: DPI resolution (default: 300)
+        
+    Returns:
+        DPI the image was rendered at, or None for a blank sheet
     """
-    workbook = Workbook()
-    workbook.LoadFromFile(excel_file)
+    return convert_sheet_to_image(excel_file, output_file, sheet_index, dpi, no_margin=True)
+
+
+def convert_worksheet_to_image(excel_file, output_file, sheet_index=0, dpi=300):
+    """
+    Convert Excel worksheet to image, keeping the page margins
     
-    converterSetting = workbook.ConverterSetting
-    converterSetting.XDpi = dpi
-    converterSetting.YDpi = dpi
+    Args:
+        excel_file: Input Excel file path
+        output_file: Output image file path
+        sheet_index: Worksheet index (default: 0)
+        dpi: DPI resolution (default: 300)
+        
+    Returns:
+        DPI the image was rendered at, or None for a blank sheet
+    """
+    return convert_sheet_to_image(excel_file, output_file, sheet_index, dpi, no_margin=False)
+
+
+# Workbooks opened once per worker process by _init_render_worker
+_worker_workbook = None
+_worker_render_workbook = None
+
+
+def _init_render_worker(input_file, dpi):
+    """Load the Excel file and create the render workbook once in each worker process"""
+    global _worker_workbook, _worker_render_workbook
+    _worker_workbook = load_workbook(input_file, dpi)
+    _worker_render_workbook = create_render_workbook(dpi)
+
+
+def _render_sheet_in_worker(sheet_name, output_file, no_margin):
+    """Render a sheet with the worker's own workbooks"""
+    worksheet = _worker_workbook.Worksheets.get_Item(sheet_name)
+    return render_worksheet(worksheet, output_file, _worker_render_workbook, no_margin)
+
+
+def convert_worksheets_batch(input_file, jobs, dpi=300, no_margin=True):
+    """
+    Convert sheets to images in this process, loading the Excel file once
+    
+    Args:
+        input_file: Input Excel file path
+        jobs: List of (sheet_name, image_path) tuples
+        dpi: DPI resolution (default: 300)
+        no_margin: Remove margins from images (default: True)
+        
+    Yields:
+        (job_index, rendered_dpi, error) tuples in job order, rendered_dpi
+        is None for blank sheets and failures, error is None on success
+    """
+    workbook = load_workbook(input_file, dpi)
+    render_workbook = create_render_workbook(dpi)
     
-    sheet = workbook.Worksheets.get_Item(sheet_index)
+    try:
+        for i, (sheet_name, image_path) in enumerate(jobs):
+            try:
+                worksheet = workbook.Worksheets.get_Item(sheet_name)
+                rendered_dpi = render_worksheet(worksheet, image_path, render_workbook, no_margin)
+                yield i, rendered_dpi, None
+            except Exception as e:
+                yield i, None, e
+    finally:
+        render_workbook.Dispose()
+        workbook.Dispose()
+
+
+def iter_converted_images(input_file, jobs, dpi, no_margin=True, parallel=True, max_workers=None):
+    """
+    Convert sheets to images, in worker processes when parallel
     
-    sheet.PageSetup.TopMargin = 0
-    sheet.PageSetup.BottomMargin = 0
-    sheet.PageSetup.LeftMargin = 0
-    sheet.PageSetup.RightMargin = 0
+    The Excel file is loaded once per process and every sheet is rendered
+    through one reused render workbook.
     
-    image = sheet.ToImage(sheet.FirstRow, sheet.FirstColumn, sheet.LastRow, sheet.LastColumn)
+    Args:
+        input_file: Input Excel file path
+        jobs: List of (sheet_name, image_path) tuples
+        dpi: DPI resolution
+        no_margin: Remove margins from images (default: True)
+        parallel: Convert sheets in parallel worker processes (default: True)
+        max_workers: Number of worker processes (None = one per CPU)
+        
+    Yields:
+        (job_index, rendered_dpi, error) tuples as each sheet finishes,
+        rendered_dpi is None for blank sheets and failures, error is None on success
+    """
+    max_workers = min(len(jobs), max_workers or os.cpu_count() or 1)
     
-    image.Save(output_file)
+    if not parallel or max_workers < 2:
+        yield from convert_worksheets_batch(input_file, jobs, dpi, no_margin)
+        return
     
-    workbook.Dispose()
+    # Spawn fresh workers, forking after Spire has run in this process can hang
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context('spawn'),
+        initializer=_init_render_worker,
+        initargs=(input_file, dpi)
+    ) as executor:
+        futures = {
+            executor.submit(_render_sheet_in_worker, sheet_name, image_path, no_margin): i
+            for i, (sheet_name, image_path) in enumerate(jobs)
+        }
+        for future in as_completed(futures):
+            error = future.exception()
+            yield futures[future], None if error else future.result(), error
 
 
-def convert_excel_to_images(input_file, output_dir, no_margin=True, keep_temp_files=False, dpi=300):
+def convert_excel_to_images(
+    input_file,
+    output_dir,
+    no_margin=True,
+    keep_temp_files=False,
+    dpi=300,
+    *,
+    parallel=True,
+    max_workers=None,
+    force=False
+):
     """
     Convert all sheets in Excel file to images
     
@@ -80,85 +499,118 @@ def convert_excel_to_images(input_file, output_dir, no_margin=True, keep_temp_fi
         input_file: Input Excel file path
         output_dir: Output directory for images
         no_margin: Remove margins from images (default: True)
-        keep_temp_files: Keep temporary split Excel files (default: False)
+        keep_temp_files: Deprecated and ignored, sheets are no longer split
+            into temporary files
         dpi: DPI resolution (default: 300)
+        parallel: Convert sheets in parallel worker processes (default: True)
+        max_workers: Number of worker processes, each holds its own copy of the
+            workbook, lower it to cap memory use (None = one per CPU)
+        force: Render images again even when the manifest in output_dir shows
+            they were written from this file with the same settings (default: False)
         
     Returns:
         List of (sheet_name, image_path) tuples
     """
+    if keep_temp_files:
+        warnings.warn(
+            "keep_temp_files is ignored, sheets are no longer split into temporary files",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+    
     try:
-        os.makedirs(output_dir, exist_ok=True)
-        
-        temp_dir = tempfile.mkdtemp(prefix="excel_split_")
+        output_path = Path(output_dir)
+        output_path.mkdir(parents=True, exist_ok=True)
         
         print("=" * 70)
         print(f"Converting Excel to Images: {input_file}")
         print("=" * 70)
         print()
         
-        # Step 1: Split Excel by sheets
-        print("Step 1: Splitting Excel file by sheets...")
+        # Step 1: Read the sheet list, Spire only loads the file to render
+        print("Step 1: Reading sheets...")
         print("-" * 70)
-        split_files = split_excel_by_sheets(input_file, temp_dir)
-        print(f"✓ Split into {len(split_files)} sheet(s)\n")
+        sheet_bounds = probe_sheet_bounds(input_file)
         
-        # Step 2: Convert each split file to image
+        # Create safe filename for each image
+        jobs = []
+        for sheet_name in sheet_bounds:
+            safe_name = UNSAFE_FILENAME_CHARS.sub('_', sheet_name)
+            image_path = str(output_path / f"{safe_name}.png")
+            jobs.append((sheet_name, image_path))
+        
+        print(f"✓ Found {len(jobs)} sheet(s)\n")
+        
+        # Images are named after their sheet only, so the manifest records which
+        # workbook and settings wrote each one. Images it matches are kept
+        manifest = read_image_manifest(output_path)
+        source_entry = image_source_entry(input_file, dpi, no_margin)
+        converted = {}
+        if not force:
+            for i, (sheet_name, image_path) in enumerate(jobs):
+                image_name = os.path.basename(image_path)
+                if manifest.get(image_name) == source_entry and os.path.exists(image_path):
+                    converted[i] = (sheet_name, image_path)
+        up_to_date = len(converted)
+        pending = [i for i in range(len(jobs)) if i not in converted]
+        
+        # Small workbooks render faster in one batch than in worker processes
+        total_cells = sum(
+            (last_row - first_row + 1) * (last_column - first_column + 1)
+            for first_row, first_column, last_row, last_column in filter(
+                None, (sheet_bounds[jobs[i][0]] for i in pending)
+            )
+        )
+        parallel = parallel and total_cells >= MIN_PARALLEL_CELLS
+        
+        # Step 2: Convert each sheet to image
         print("Step 2: Converting each sheet to image...")
         print("-" * 70)
         print(f"Quality Settings: {dpi} DPI")
         print("-" * 70)
         
-        image_files = []
+        for i in sorted(converted):
+            print(f"  - '{converted[i][0]}' up to date: {converted[i][1]}")
+        
+        skipped = 0
+        
+        # Only start Spire when there is something to render
+        results = iter_converted_images(
+            input_file, [jobs[i] for i in pending], dpi, no_margin, parallel, max_workers
+        ) if pending else []
         
-        for i, (sheet_name, excel_path) in enumerate(split_files, 1):
-            # Create safe filename for image
-            safe_name = "".join(c if c.isalnum() or c in (' ', '-', '_') else '_' for c in sheet_name)
-            image_path = os.path.join(output_dir, f"{safe_name}.png")
+        for done, (j, rendered_dpi, error) in enumerate(results, 1):
+            i = pending[j]
+            sheet_name, image_path = jobs[i]
+            # Whatever image was there before no longer matches this render
+            manifest.pop(os.path.basename(image_path), None)
             
-            try:
-                if no_margin:
-                    convert_worksheet_to_image_no_margin(
-                        excel_path, 
-                        image_path, 
-                        sheet_index=0,
-                        dpi=dpi
-                    )
-                else:
-                    workbook = Workbook()
-                    workbook.LoadFromFile(excel_path)
-                    
-                    converterSetting = workbook.ConverterSetting
-                    converterSetting.XDpi = dpi
-                    converterSetting.YDpi = dpi
-                    
-                    sheet = workbook.Worksheets.get_Item(0)
-                    image = sheet.ToImage(sheet.FirstRow, sheet.FirstColumn, 
-                                        sheet.LastRow, sheet.LastColumn)
-                    image.Save(image_path)
-                    workbook.Dispose()
-                
-                image_files.append((sheet_name, image_path))
-                print(f"  [{i}/{len(split_files)}] ✓ '{sheet_name}' -> {image_path}")
-                
-            except Exception as e:
-                print(f"  [{i}/{len(split_files)}] ✗ '{sheet_name}' - Error: {str(e)}")
+            if error is not None:
+                print(f"  [{done}/{len(pending)}] ✗ '{sheet_name}' - Error: {str(error)}")
+            elif rendered_dpi is None:
+                skipped += 1
+                print(f"  [{done}/{len(pending)}] - '{sheet_name}' skipped (blank sheet)")
+            else:
+                converted[i] = (sheet_name, image_path)
+                manifest[os.path.basename(image_path)] = source_entry
+                print(f"  [{done}/{len(pending)}] ✓ '{sheet_name}' -> {image_path}")
+                if rendered_dpi < dpi:
+                    print(f"      ! Too large for {dpi} DPI, rendered at {rendered_dpi} DPI")
         
-        print()
+        if pending:
+            write_image_manifest(output_path, manifest)
         
-        # Step 3: Clean up temporary files
-        if not keep_temp_files:
-            print("Step 3: Cleaning up temporary files...")
-            print("-" * 70)
-            shutil.rmtree(temp_dir)
-            print(f"✓ Removed temporary directory: {temp_dir}\n")
-        else:
-            print(f"Step 3: Temporary files kept at: {temp_dir}\n")
+        # Keep the images in sheet order, workers finish in any order
+        image_files = [converted[i] for i in sorted(converted)]
         
+        print()
         print("=" * 70)
         print(f"✓ Conversion complete!")
-        print(f"  Total sheets: {len(split_files)}")
-        print(f"  Successfully converted: {len(image_files)}")
-        print(f"  Failed: {len(split_files) - len(image_files)}")
+        print(f"  Total sheets: {len(jobs)}")
+        print(f"  Successfully converted: {len(image_files) - up_to_date}")
+        print(f"  Up to date: {up_to_date}")
+        print(f"  Skipped (blank): {skipped}")
+        print(f"  Failed: {len(jobs) - len(image_files) - skipped}")
         print(f"  Output directory: {output_dir}")
         print("=" * 70)
         
@@ -169,14 +621,15 @@ def convert_excel_to_images(input_file, output_dir, no_margin=True, keep_temp_fi
         return []
 
 
-def convert_excel_to_images_simple(input_file, output_dir="output/images", dpi=300):
+def convert_excel_to_images_simple(input_file, output_dir="output/images", dpi=150, force=False):
     """
     Simple wrapper function to convert Excel to images
     
     Args:
         input_file: Input Excel file path
         output_dir: Output directory for images (default: "output/images")
-        dpi: DPI resolution (default: 300)
+        dpi: DPI resolution (default: 150, enough for screen; use 300+ for printing)
+        force: Render images that are already up to date again (default: False)
         
     Returns:
         List of generated image paths
@@ -185,7 +638,8 @@ def convert_excel_to_images_simple(input_file, output_dir="output/images", dpi=3
         input_file, 
         output_dir, 
         no_margin=True, 
-        dpi=dpi
+        dpi=dpi,
+        force=force
     )
     return [img_path for _, img_path in result]
 
@@ -194,13 +648,14 @@ if __name__ == "__main__":
 
     input_file = "examples/test_img.xlsx"
     output_dir = "output/images"
+    # DPI resolution: 150 is enough for screen and web use, 300+ for printing.
+    # Render time and file size grow with DPI
     dpi = 300
     
     result = convert_excel_to_images(
         input_file=input_file,
         output_dir=output_dir,
         no_margin=True,
-        keep_temp_files=False,
         dpi=dpi
     )
     
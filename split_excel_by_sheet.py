@@ -1,7 +1,36 @@
-from spire.xls import *
-from spire.xls.common import *
 import os
 
+from excel_processor import Workbook, FileFormat
+
+
+def save_sheet_copy(worksheet, output_dir):
+    """
+    Save a copy of a worksheet as a separate Excel file
+    
+    Args:
+        worksheet: Worksheet of a loaded Workbook
+        output_dir: Output directory for the file
+        
+    Returns:
+        Path of the saved file, named after the sheet
+    """
+    # Create a new Workbook object
+    newWorkbook = Workbook()
+    # Clear default worksheets in new workbook
+    newWorkbook.Worksheets.Clear()
+    
+    # Copy worksheet from original Excel file to new workbook
+    newWorkbook.Worksheets.AddCopy(worksheet)
+    
+    # Save new workbook to specified folder
+    output_file = os.path.join(output_dir, f"{worksheet.Name}.xlsx")
+    newWorkbook.SaveToFile(output_file, FileFormat.Version2016)
+    
+    # Release resources
+    newWorkbook.Dispose()
+    
+    return output_file
+
 
 def split_excel_by_sheets(input_file, output_dir):
     """
@@ -24,22 +53,9 @@ def split_excel_by_sheets(input_file, output_dir):
         
         # Iterate through all worksheets
         for i, worksheet in enumerate(workbook.Worksheets, 1):
-            # Create a new Workbook object
-            newWorkbook = Workbook()
-            # Clear default worksheets in new workbook
-            newWorkbook.Worksheets.Clear()
-            
-            # Copy worksheet from original Excel file to new workbook
-            newWorkbook.Worksheets.AddCopy(worksheet)
-            
-            # Save new workbook to specified folder
-            output_file = os.path.join(output_dir, f"{worksheet.Name}.xlsx")
-            newWorkbook.SaveToFile(output_file, FileFormat.Version2016)
+            output_file = save_sheet_copy(worksheet, output_dir)
             
             print(f"[{i}/{workbook.Worksheets.Count}] Successfully split sheet '{worksheet.Name}' to: {output_file}")
-            
-            # Release resources
-            newWorkbook.Dispose()
         
         # Release original workbook resources
         workbook.Dispose()
@@ -87,23 +103,10 @@ def split_excel_by_sheets_with_filter(input_file, output_dir, sheet_names=None,
                 print(f"Skipping sheet '{sheet_name}' (in exclude list)")
                 continue
             
-            # Create a new Workbook object
-            newWorkbook = Workbook()
-            # Clear default worksheets in new workbook
-            newWorkbook.Worksheets.Clear()
-            
-            # Copy worksheet from original Excel file to new workbook
-            newWorkbook.Worksheets.AddCopy(worksheet)
-            
-            # Save new workbook to specified folder
-            output_file = os.path.join(output_dir, f"{sheet_name}.xlsx")
-            newWorkbook.SaveToFile(output_file, FileFormat.Version2016)
+            output_file = save_sheet_copy(worksheet, output_dir)
             
             split_count += 1
             print(f"✓ Successfully split sheet '{sheet_name}' to: {output_file}")
-            
-            # Release resources
-            newWorkbook.Dispose()
         
         # Release original workbook resources
         workbook.Dispose()
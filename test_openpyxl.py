@@ -12,9 +12,14 @@ Extracts all content from Excel files including:
 """
 
 import os
+import re
+import posixpath
 import json
+import shutil
 import zipfile
 import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Any, Optional, Tuple
@@ -22,52 +27,131 @@ from openpyxl import load_workbook
 from openpyxl.worksheet.worksheet import Worksheet
 from openpyxl.utils import get_column_letter, column_index_from_string
 
+from excel_markdown import format_markdown_cell, make_safe_filename
+
+# Spreadsheet drawing namespace, written out so tags match without prefix lookups
+XDR = '{http://schemas.openxmlformats.org/drawingml/2006/spreadsheetDrawing}'
+
+# Namespaces of the workbook, relationship and drawing parts
+MAIN = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+REL = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}'
+PKG_REL = '{http://schemas.openxmlformats.org/package/2006/relationships}'
+DRAWINGML = '{http://schemas.openxmlformats.org/drawingml/2006/main}'
+
+# Image sizes in the drawing parts are in EMU, 9525 per pixel at 96 dpi
+EMU_PER_PIXEL = 9525
+
+# Cell reference such as "AB12", split into column letters and row number
+CELL_REFERENCE = re.compile(r'([A-Z]+)(\d+)')
+
+# Buffer size for streaming media files out of the archive
+COPY_BUFFER_SIZE = 1 << 20
+
+# Write buffer for the Markdown report, written a line at a time
+MARKDOWN_BUFFER_SIZE = 1 << 20
+
+# Line breaks in comment text, which is listed one comment per line
+COMMENT_TEXT_ESCAPES = str.maketrans({'\n': ' ', '\r': ''})
+
 
 class ExcelExtractor:
     """Extract all content from Excel files"""
     
-    def __init__(self, excel_path: str, output_dir: str = "extracted_content"):
+    def __init__(self, excel_path: str, output_dir: str = "extracted_content", read_only: bool = False,
+                 extract_styles: bool = True):
         """
         Initialize the extractor
         
         Args:
             excel_path: Path to the Excel file
             output_dir: Directory to save extracted content
+            read_only: Stream cell values only, much faster and lighter on large
+                files but without styles, merged cells, hyperlinks, comments or charts
+            extract_styles: Extract cell styles, the Markdown report does not use them
         """
         self.excel_path = excel_path
         self.output_dir = output_dir
+        self.read_only = read_only
+        self.extract_styles = extract_styles
         self.workbook = None
         self.extracted_data = {}
         
+        # Style dicts keyed by the cell's style ids, see extract_cell_style
+        self._style_cache = {}
+        
+        # Pictures anchored on each sheet, see _index_images
+        self._image_index = None
+        
         # Create output directory
         Path(self.output_dir).mkdir(parents=True, exist_ok=True)
         
     def load_excel(self):
         """Load the Excel workbook"""
         print(f"Loading Excel file: {self.excel_path}")
-        self.workbook = load_workbook(
-            self.excel_path,
-            data_only=False,  # Keep formulas
-            keep_vba=True,    # Keep VBA macros if present
-        )
+        if self.read_only:
+            # Read-only workbooks keep the file open, close the previous one
+            if self.workbook is not None:
+                self.workbook.close()
+            self.workbook = load_workbook(
+                self.excel_path,
+                read_only=True,   # Stream rows instead of building every cell
+                data_only=False,  # Keep formulas
+                keep_links=False,
+            )
+        else:
+            self.workbook = load_workbook(
+                self.excel_path,
+                data_only=False,  # Keep formulas
+                keep_links=False,
+            )
+        # Style ids are per workbook
+        self._style_cache = {}
+        self._image_index = None
         print(f"Workbook loaded successfully with {len(self.workbook.sheetnames)} sheets")
         
     def extract_cell_value(self, cell) -> Dict[str, Any]:
         """Extract cell value and metadata"""
+        value = cell._value
         cell_data = {
-            "value": cell.value,
+            "value": value,
             "data_type": cell.data_type,
             "number_format": cell.number_format,
         }
         
         # Extract formula if present
-        if cell.value and isinstance(cell.value, str) and cell.value.startswith('='):
-            cell_data["formula"] = cell.value
+        if isinstance(value, str) and value.startswith('='):
+            cell_data["formula"] = value
             
         return cell_data
     
+    def extract_cell_values(self, worksheet) -> Dict[str, Dict[str, Any]]:
+        """Extract cell values only, streaming the rows of a read-only worksheet"""
+        cells = {}
+        for row_idx, row in enumerate(worksheet.iter_rows(values_only=True), 1):
+            for col_idx, value in enumerate(row, 1):
+                if value is None:
+                    continue
+                
+                cell_data = {"value": value}
+                if isinstance(value, str) and value.startswith('='):
+                    cell_data["formula"] = value
+                
+                cells[f"{get_column_letter(col_idx)}{row_idx}"] = {
+                    "data": cell_data,
+                    "style": {},
+                }
+        return cells
+    
     def extract_cell_style(self, cell) -> Dict[str, Any]:
-        """Extract cell styling information"""
+        """Extract cell styling information
+        Cells sharing the same style ids share one (read-only) style dict
+        """
+        # Workbooks hold few distinct styles, build each one only once
+        style_key = tuple(cell._style)
+        style_data = self._style_cache.get(style_key)
+        if style_data is not None:
+            return style_data
+        
         style_data = {}
         
         # Font information
@@ -107,6 +191,7 @@ class ExcelExtractor:
                 "bottom": str(cell.border.bottom.style) if cell.border.bottom else None,
             }
         
+        self._style_cache[style_key] = style_data
         return style_data
     
     def extract_merged_cells(self, worksheet: Worksheet) -> List[str]:
@@ -116,16 +201,29 @@ class ExcelExtractor:
             merged_cells.append(str(merged_range))
         return merged_cells
     
+    @staticmethod
+    def extract_cell_hyperlink(hyperlink, display) -> Dict[str, Any]:
+        """Extract a cell's hyperlink, display is the cell value"""
+        return {
+            "url": hyperlink.target,
+            "display": display,
+            "tooltip": hyperlink.tooltip if hasattr(hyperlink, 'tooltip') else None,
+        }
+    
+    @staticmethod
+    def extract_cell_comment(comment) -> Dict[str, str]:
+        """Extract a cell's comment"""
+        return {
+            "text": comment.text,
+            "author": comment.author,
+        }
+    
     def extract_hyperlinks(self, worksheet: Worksheet) -> Dict[str, str]:
         """Extract hyperlinks from cells"""
         hyperlinks = {}
         for cell in worksheet._cells.values():
             if cell.hyperlink:
-                hyperlinks[cell.coordinate] = {
-                    "url": cell.hyperlink.target,
-                    "display": cell.value,
-                    "tooltip": cell.hyperlink.tooltip if hasattr(cell.hyperlink, 'tooltip') else None,
-                }
+                hyperlinks[cell.coordinate] = self.extract_cell_hyperlink(cell.hyperlink, cell.value)
         return hyperlinks
     
     def extract_comments(self, worksheet: Worksheet) -> Dict[str, Dict[str, str]]:
@@ -133,138 +231,192 @@ class ExcelExtractor:
         comments = {}
         for cell in worksheet._cells.values():
             if cell.comment:
-                comments[cell.coordinate] = {
-                    "text": cell.comment.text,
-                    "author": cell.comment.author,
-                }
+                comments[cell.coordinate] = self.extract_cell_comment(cell.comment)
         return comments
     
-    def _parse_drawing_positions(self, sheet_name: str) -> Dict[str, Tuple[int, int, int, int]]:
-        """Parse drawing.xml to get image positions
-        Returns: dict mapping image file to (from_col, from_row, to_col, to_row)
+    def _scan_cells(self, worksheet: Worksheet) -> Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]:
+        """Extract cells, hyperlinks and comments in a single pass over the stored cells
+        Returns: (cells, hyperlinks, comments) dicts keyed by cell coordinate
+        """
+        cells = {}
+        hyperlinks = {}
+        comments = {}
+        extract_styles = self.extract_styles
+        
+        # Only cells stored in the sheet can hold anything, walk them in row
+        # order instead of iter_rows() which creates every empty cell in the range
+        stored_cells = worksheet._cells
+        for key in sorted(stored_cells):
+            cell = stored_cells[key]
+            # Merged cells are stored too and only have the public properties
+            # for links and comments. has_style stays, the style array is
+            # never empty and needs a check
+            value = cell._value
+            hyperlink = cell.hyperlink
+            comment = cell.comment
+            has_content = value is not None or (extract_styles and cell.has_style)
+            
+            if not has_content and hyperlink is None and comment is None:
+                continue
+            
+            coordinate = cell.coordinate
+            
+            if hyperlink:
+                hyperlinks[coordinate] = self.extract_cell_hyperlink(hyperlink, value)
+            
+            if comment:
+                comments[coordinate] = self.extract_cell_comment(comment)
+            
+            if has_content:
+                cells[coordinate] = {
+                    "data": self.extract_cell_value(cell),
+                    "style": self.extract_cell_style(cell) if extract_styles else {},
+                }
+        
+        return cells, hyperlinks, comments
+    
+    @staticmethod
+    def _read_rels(zip_ref: zipfile.ZipFile, part: str) -> Dict[str, str]:
+        """Read the relationships of an archive part
+        Returns: dict mapping relationship id to target part path, empty if the part has none
         """
-        positions = {}
+        part_dir, part_name = posixpath.split(part)
+        rels_file = f"{part_dir}/_rels/{part_name}.rels"
+        try:
+            with zip_ref.open(rels_file) as rels:
+                root = ET.parse(rels).getroot()
+        except KeyError:
+            return {}
+        
+        targets = {}
+        for rel in root.iter(f'{PKG_REL}Relationship'):
+            if rel.get('TargetMode') == 'External':
+                continue
+            target = rel.get('Target')
+            # Targets are relative to the part's folder unless rooted
+            if target.startswith('/'):
+                targets[rel.get('Id')] = target[1:]
+            else:
+                targets[rel.get('Id')] = posixpath.normpath(posixpath.join(part_dir, target))
+        return targets
+    
+    def _index_images(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Map each sheet to the pictures anchored on it
+        Follows workbook -> sheet -> drawing -> media relationships in one pass over the archive
+        Returns: dict mapping sheet name to a list of picture dicts with the media
+            "source" part, "position" as (from_col, from_row, to_col, to_row) and
+            "width"/"height" in pixels
+        """
+        # The archive holds the pictures of every sheet, read it once per workbook
+        if self._image_index is not None:
+            return self._image_index
+        
+        image_index = {}
         
         try:
-            # Find the sheet's relationship ID
             with zipfile.ZipFile(self.excel_path, 'r') as zip_ref:
-                # Read workbook.xml.rels to find sheet file
-                # Then read sheet's .rels to find drawing file
-                # Then parse drawing.xml
+                workbook_part = 'xl/workbook.xml'
+                sheet_parts = self._read_rels(zip_ref, workbook_part)
+                with zip_ref.open(workbook_part) as workbook_xml:
+                    sheets = ET.parse(workbook_xml).getroot().iter(f'{MAIN}sheet')
+                    sheets = [(sheet.get('name'), sheet.get(f'{REL}id')) for sheet in sheets]
                 
-                # For simplicity, try common drawing files
-                for drawing_idx in range(1, 10):
-                    drawing_file = f'xl/drawings/drawing{drawing_idx}.xml'
-                    if drawing_file not in zip_ref.namelist():
+                for sheet_name, sheet_rel in sheets:
+                    sheet_part = sheet_parts.get(sheet_rel)
+                    if sheet_part is None:
                         continue
                     
-                    # Parse the drawing XML
-                    content = zip_ref.read(drawing_file)
-                    root = ET.fromstring(content)
-                    
-                    # Define namespace
-                    ns = {'xdr': 'http://schemas.openxmlformats.org/drawingml/2006/spreadsheetDrawing'}
-                    
-                    # Find all anchor elements with images
-                    img_idx = 1
-                    for anchor in root.findall('.//xdr:twoCellAnchor', ns) + root.findall('.//xdr:oneCellAnchor', ns):
-                        # Get from position
-                        from_elem = anchor.find('.//xdr:from', ns)
-                        if from_elem is not None:
-                            from_col = int(from_elem.find('xdr:col', ns).text)
-                            from_row = int(from_elem.find('xdr:row', ns).text)
+                    pictures = []
+                    # A sheet's relationships also list hyperlinks, comments and such,
+                    # only drawing parts hold pictures
+                    for drawing_part in self._read_rels(zip_ref, sheet_part).values():
+                        if not drawing_part.startswith('xl/drawings/') or not drawing_part.endswith('.xml'):
+                            continue
+                        media_parts = self._read_rels(zip_ref, drawing_part)
+                        with zip_ref.open(drawing_part) as drawing:
+                            root = ET.parse(drawing).getroot()
+                        
+                        # Anchors are direct children of the drawing root, in drawing order
+                        for anchor in root:
+                            from_elem = anchor.find(f'{XDR}from')
+                            blip = anchor.find(f'{XDR}pic/{XDR}blipFill/{DRAWINGML}blip')
+                            if from_elem is None or blip is None:
+                                continue
+                            media_part = media_parts.get(blip.get(f'{REL}embed'))
+                            if media_part is None:
+                                continue
+                            
+                            from_col = int(from_elem.findtext(f'{XDR}col'))
+                            from_row = int(from_elem.findtext(f'{XDR}row'))
                             
                             # Get to position (if two-cell anchor)
                             to_col, to_row = from_col, from_row
-                            to_elem = anchor.find('.//xdr:to', ns)
+                            to_elem = anchor.find(f'{XDR}to')
                             if to_elem is not None:
-                                to_col = int(to_elem.find('xdr:col', ns).text)
-                                to_row = int(to_elem.find('xdr:row', ns).text)
+                                to_col = int(to_elem.findtext(f'{XDR}col'))
+                                to_row = int(to_elem.findtext(f'{XDR}row'))
+                            
+                            # Picture size as drawn, one-cell anchors carry it on the anchor
+                            width = height = None
+                            extent = anchor.find(f'{XDR}ext')
+                            if extent is None:
+                                extent = anchor.find(f'{XDR}pic/{XDR}spPr/{DRAWINGML}xfrm/{DRAWINGML}ext')
+                            if extent is not None:
+                                width = round(int(extent.get('cx')) / EMU_PER_PIXEL)
+                                height = round(int(extent.get('cy')) / EMU_PER_PIXEL)
                             
-                            # Store position (use generic key since we don't have image-to-position mapping yet)
-                            positions[f'image_{img_idx}'] = (from_col, from_row, to_col, to_row)
-                            img_idx += 1
+                            pictures.append({
+                                "source": media_part,
+                                "position": (from_col, from_row, to_col, to_row),
+                                "width": width,
+                                "height": height,
+                            })
+                    
+                    if pictures:
+                        image_index[sheet_name] = pictures
         except Exception as e:
-            print(f"  Warning: Could not parse drawing positions: {e}")
+            print(f"  Warning: Could not index images: {e}")
         
-        return positions
+        self._image_index = image_index
+        return image_index
     
     def extract_images(self, worksheet: Worksheet, sheet_name: str) -> List[Dict[str, Any]]:
         """Extract images from worksheet"""
         images_info = []
         
-        # Get image positions from drawing.xml
-        image_positions = self._parse_drawing_positions(sheet_name)
+        pictures = self._index_images().get(sheet_name)
+        if not pictures:
+            return images_info
         
-        # Method 1: Try standard _images attribute
-        if hasattr(worksheet, '_images') and worksheet._images:
-            for idx, image in enumerate(worksheet._images):
-                # Save image to file
-                image_filename = f"{sheet_name}_image_{idx + 1}.{image.format}"
-                image_path = os.path.join(self.output_dir, image_filename)
-                
-                with open(image_path, "wb") as img_file:
-                    img_file.write(image._data())
-                
-                # Get position if available
-                pos_key = f'image_{idx + 1}'
-                position = image_positions.get(pos_key)
-                
-                images_info.append({
-                    "filename": image_filename,
-                    "format": image.format,
-                    "anchor": str(image.anchor) if hasattr(image, 'anchor') else None,
-                    "width": image.width if hasattr(image, 'width') else None,
-                    "height": image.height if hasattr(image, 'height') else None,
-                    "position": position,  # (from_col, from_row, to_col, to_row)
-                })
-                print(f"  Extracted image: {image_filename}")
-        
-        # Method 2: Extract directly from ZIP file (for all sheets on first call)
-        # Only do this once for the workbook
-        if not images_info and not hasattr(self, '_images_extracted_from_zip'):
-            self._images_extracted_from_zip = True
-            try:
-                with zipfile.ZipFile(self.excel_path, 'r') as zip_ref:
-                    # Find all media files
-                    media_files = [f for f in zip_ref.namelist() if 'xl/media/' in f and not f.endswith('/')]
+        try:
+            with zipfile.ZipFile(self.excel_path, 'r') as zip_ref:
+                for idx, picture in enumerate(pictures, 1):
+                    media_file = picture["source"]
+                    # Extract file extension
+                    file_ext = posixpath.splitext(media_file)[1][1:]  # Remove the dot
+                    if not file_ext:
+                        file_ext = 'png'  # default
                     
-                    if media_files:
-                        print(f"  Found {len(media_files)} image(s) in workbook")
-                        
-                        for idx, media_file in enumerate(media_files, 1):
-                            # Extract file extension
-                            file_ext = os.path.splitext(media_file)[1][1:]  # Remove the dot
-                            if not file_ext:
-                                file_ext = 'png'  # default
-                            
-                            # Use generic naming since we can't determine which sheet
-                            image_filename = f"workbook_image_{idx}.{file_ext}"
-                            image_path = os.path.join(self.output_dir, image_filename)
-                            
-                            # Extract and save image
-                            with open(image_path, 'wb') as img_file:
-                                img_file.write(zip_ref.read(media_file))
-                            
-                            # Get position if available
-                            pos_key = f'image_{idx}'
-                            position = image_positions.get(pos_key)
-                            
-                            # Get image info
-                            images_info.append({
-                                "filename": image_filename,
-                                "format": file_ext.upper(),
-                                "source": media_file,
-                                "anchor": None,
-                                "width": None,
-                                "height": None,
-                                "position": position,  # (from_col, from_row, to_col, to_row)
-                            })
-                            print(f"  Extracted image: {image_filename} at position {position}")
-            except Exception as e:
-                print(f"  Warning: Could not extract images from ZIP: {e}")
-        
-        return images_info
+                    image_filename = f"{make_safe_filename(sheet_name)}_image_{idx}.{file_ext}"
+                    image_path = os.path.join(self.output_dir, image_filename)
+                    
+                    # Stream the image to disk without holding it in memory
+                    with zip_ref.open(media_file) as src, open(image_path, 'wb') as img_file:
+                        shutil.copyfileobj(src, img_file, COPY_BUFFER_SIZE)
+                    
+                    position = picture["position"]
+                    images_info.append({
+                        "filename": image_filename,
+                        "format": file_ext.upper(),
+                        "source": media_file,
+                        "anchor": f"{get_column_letter(position[0] + 1)}{position[1] + 1}",
+                        "width": picture["width"],
+                        "height": picture["height"],
+                        "position": position,  # (from_col, from_row, to_col, to_row)
+                    })
+                    print(f"  Extracted image: {image_filename} at position {position}")
+        except Exception as e:
+            print(f"  Warning: Could not extract images from ZIP: {e}")
         
         return images_info
     
@@ -307,6 +459,19 @@ class ExcelExtractor:
     
     def extract_sheet_properties(self, worksheet: Worksheet) -> Dict[str, Any]:
         """Extract worksheet properties"""
+        if self.read_only:
+            # Files written without a dimension record need a pass to size the sheet
+            if worksheet.max_row is None or worksheet.max_column is None:
+                worksheet.calculate_dimension(force=True)
+            
+            # Views and row/column dimensions are not loaded in read-only mode
+            return {
+                "title": worksheet.title,
+                "max_row": worksheet.max_row,
+                "max_column": worksheet.max_column,
+                "sheet_state": worksheet.sheet_state,
+            }
+        
         properties = {
             "title": worksheet.title,
             "max_row": worksheet.max_row,
@@ -338,26 +503,37 @@ class ExcelExtractor:
         sheet_name = worksheet.title
         print(f"\nExtracting sheet: {sheet_name}")
         
+        if self.read_only:
+            # Read-only worksheets only stream values, the rest is not loaded
+            sheet_data = {
+                "properties": self.extract_sheet_properties(worksheet),
+                "cells": {},
+                "merged_cells": [],
+                "hyperlinks": {},
+                "comments": {},
+                "images": self.extract_images(worksheet, sheet_name),
+                "charts": [],
+            }
+            
+            print(f"  Extracting cell values...")
+            sheet_data["cells"] = self.extract_cell_values(worksheet)
+            
+            print(f"  Extracted {len(sheet_data['cells'])} cells")
+            return sheet_data
+        
         sheet_data = {
             "properties": self.extract_sheet_properties(worksheet),
             "cells": {},
             "merged_cells": self.extract_merged_cells(worksheet),
-            "hyperlinks": self.extract_hyperlinks(worksheet),
-            "comments": self.extract_comments(worksheet),
+            "hyperlinks": {},
+            "comments": {},
             "images": self.extract_images(worksheet, sheet_name),
             "charts": self.extract_charts(worksheet),
         }
         
-        # Extract cell data and styles
+        # Extract cell data and styles, hyperlinks and comments in one pass
         print(f"  Extracting cells...")
-        for row in worksheet.iter_rows():
-            for cell in row:
-                if cell.value is not None or cell.has_style:
-                    cell_key = cell.coordinate
-                    sheet_data["cells"][cell_key] = {
-                        "data": self.extract_cell_value(cell),
-                        "style": self.extract_cell_style(cell),
-                    }
+        sheet_data["cells"], sheet_data["hyperlinks"], sheet_data["comments"] = self._scan_cells(worksheet)
         
         print(f"  Extracted {len(sheet_data['cells'])} cells")
         print(f"  Found {len(sheet_data['merged_cells'])} merged cell ranges")
@@ -395,8 +571,13 @@ class ExcelExtractor:
         
         return properties
     
-    def extract_all(self) -> Dict[str, Any]:
-        """Extract all content from the workbook"""
+    def extract_all(self, max_workers: Optional[int] = None) -> Dict[str, Any]:
+        """Extract all content from the workbook
+        
+        Args:
+            max_workers: Worker processes for read-only extraction
+                (None = one per CPU, 1 = extract sheets in this process)
+        """
         self.load_excel()
         
         print("\n" + "="*60)
@@ -408,10 +589,28 @@ class ExcelExtractor:
             "sheets": {}
         }
         
-        # Extract each worksheet
-        for sheet_name in self.workbook.sheetnames:
-            worksheet = self.workbook[sheet_name]
-            self.extracted_data["sheets"][sheet_name] = self.extract_worksheet(worksheet)
+        sheet_names = self.workbook.sheetnames
+        
+        # Read-only workbooks open cheaply and stream one sheet at a time, so
+        # sheets can be spread over worker processes. A full load parses every
+        # sheet up front, a worker would redo all of it for its single sheet
+        max_workers = min(max_workers or os.cpu_count() or 1, len(sheet_names))
+        if self.read_only and max_workers > 1:
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_init_extract_worker,
+                initargs=(self.excel_path, self.output_dir)
+            ) as executor:
+                results = executor.map(_extract_sheet_in_worker, sheet_names)
+                for sheet_name, sheet_data in zip(sheet_names, results):
+                    # Workers skip images, write them from this process
+                    sheet_data["images"] = self.extract_images(self.workbook[sheet_name], sheet_name)
+                    self.extracted_data["sheets"][sheet_name] = sheet_data
+        else:
+            # Extract each worksheet
+            for sheet_name in sheet_names:
+                worksheet = self.workbook[sheet_name]
+                self.extracted_data["sheets"][sheet_name] = self.extract_worksheet(worksheet)
         
         print("\n" + "="*60)
         print("Extraction complete!")
@@ -428,7 +627,9 @@ class ExcelExtractor:
         Returns:
             Dictionary containing sheet data
         """
-        self.load_excel()
+        # Reuse the loaded workbook, extracting sheet after sheet must not reparse the file
+        if not self.workbook:
+            self.load_excel()
         
         # Check if sheet exists
         if sheet_name not in self.workbook.sheetnames:
@@ -475,8 +676,13 @@ class ExcelExtractor:
         """Save extracted data to JSON file"""
         output_path = os.path.join(self.output_dir, output_filename)
         
+        # Encode in one go and write once, json.dump issues a write per token.
+        # The extracted data is a plain tree, so skip the circular check too
+        output = json.dumps(
+            self.extracted_data, indent=2, ensure_ascii=False, default=str, check_circular=False
+        )
         with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(self.extracted_data, f, indent=2, ensure_ascii=False, default=str)
+            f.write(output)
         
         print(f"\nExtracted data saved to: {output_path}")
         return output_path
@@ -519,17 +725,30 @@ class ExcelExtractor:
         return summary_text
     
     def generate_markdown(self, output_filename: str = "extracted_content.md") -> str:
-        """Generate a human-readable Markdown report of extracted content"""
-        md_lines = []
+        """Generate a human-readable Markdown report of extracted content
         
+        Returns:
+            Path of the saved report
+        """
+        output_path = os.path.join(self.output_dir, output_filename)
+        
+        # Write the report as it is built instead of holding all of it in memory
+        with open(output_path, 'w', encoding='utf-8', buffering=MARKDOWN_BUFFER_SIZE) as f:
+            self._write_markdown(f.write)
+        
+        print(f"\nMarkdown report saved to: {output_path}")
+        return output_path
+    
+    def _write_markdown(self, write):
+        """Write the Markdown report line by line through write"""
         # Title
-        md_lines.append(f"# {os.path.basename(self.excel_path)}")
-        md_lines.append("")
+        write(f"# {os.path.basename(self.excel_path)}\n")
+        write("\n")
         
         # Process each sheet
         for sheet_name, sheet_data in self.extracted_data.get("sheets", {}).items():
-            md_lines.append(f"## {sheet_name}")
-            md_lines.append("")
+            write(f"## {sheet_name}\n")
+            write("\n")
             
             # Get images for this sheet
             images = sheet_data.get("images", [])
@@ -557,16 +776,13 @@ class ExcelExtractor:
             # Cell data as table
             cells = sheet_data.get("cells", {})
             if cells:
-                # Organize cells by row
+                # Organize cell values by row
                 rows_dict = {}
                 for cell_ref, cell_data in cells.items():
                     # Parse cell reference (e.g., "A1" -> row=1, col=A)
-                    col = ''.join(filter(str.isalpha, cell_ref))
-                    row = int(''.join(filter(str.isdigit, cell_ref)))
+                    col, row = CELL_REFERENCE.fullmatch(cell_ref).groups()
                     
-                    if row not in rows_dict:
-                        rows_dict[row] = {}
-                    rows_dict[row][col] = cell_data
+                    rows_dict.setdefault(int(row), {})[col] = cell_data['data']['value']
                 
                 # Find all unique columns
                 all_cols = set()
@@ -578,9 +794,16 @@ class ExcelExtractor:
                 sorted_rows = sorted(rows_dict.keys())
                 
                 if sorted_rows and all_cols:
-                    # Table header
-                    md_lines.append("| " + " | ".join(all_cols) + " |")
-                    md_lines.append("|" + "|".join(["---"] * len(all_cols)) + "|")
+                    # Table header, built once and repeated whenever an image splits the table
+                    table_header = (
+                        f"| {' | '.join(all_cols)} |\n"
+                        f"|{'|'.join(['---'] * len(all_cols))}|\n"
+                    )
+                    write(table_header)
+                    
+                    # Position of each column in a table row
+                    col_index = {col: i for i, col in enumerate(all_cols)}
+                    empty_row = [""] * len(all_cols)
                     
                     # Table rows - show images after their corresponding rows
                     last_row = 0
@@ -588,51 +811,26 @@ class ExcelExtractor:
                         # First, show any images that appear between last_row and current row
                         for check_row in range(last_row + 1, row_num):
                             if check_row in image_by_row:
-                                md_lines.append("")  # End table temporarily
+                                write("\n")  # End table temporarily
                                 for img_info in image_by_row[check_row]:
-                                    md_lines.append(f"**Image at {img_info['position_text']}:**")
-                                    md_lines.append("")
-                                    md_lines.append(f"![Image]({img_info['filename']})")
-                                    md_lines.append("")
+                                    write(f"**Image at {img_info['position_text']}:**\n\n![Image]({img_info['filename']})\n\n")
                                 # Restart table
-                                md_lines.append("| " + " | ".join(all_cols) + " |")
-                                md_lines.append("|" + "|".join(["---"] * len(all_cols)) + "|")
+                                write(table_header)
                         
-                        # Show the data row
-                        row_data = rows_dict[row_num]
-                        values = []
-                        for col in all_cols:
-                            if col in row_data:
-                                value = row_data[col]['data']['value']
-                                # Format value for markdown
-                                if value is None:
-                                    value = ""
-                                elif isinstance(value, str):
-                                    # Escape pipes
-                                    value = value.replace("|", "\\|").replace("\n", " ")
-                                else:
-                                    # Convert dates and other types to string
-                                    value = str(value)
-                                    # Clean up datetime string
-                                    if "datetime" in value:
-                                        value = value.replace("datetime.datetime(", "").replace(")", "")
-                                values.append(value)
-                            else:
-                                values.append("")
-                        md_lines.append("| " + " | ".join(values) + " |")
+                        # Show the data row, only the cells present are formatted
+                        values = empty_row.copy()
+                        for col, value in rows_dict[row_num].items():
+                            values[col_index[col]] = format_markdown_cell(value)
+                        write(f"| {' | '.join(values)} |\n")
                         
                         # Check if there's an image starting at the next row
                         if row_num + 1 in image_by_row:
-                            md_lines.append("")  # End table
+                            write("\n")  # End table
                             for img_info in image_by_row[row_num + 1]:
-                                md_lines.append(f"**Image at {img_info['position_text']}:**")
-                                md_lines.append("")
-                                md_lines.append(f"![Image]({img_info['filename']})")
-                                md_lines.append("")
+                                write(f"**Image at {img_info['position_text']}:**\n\n![Image]({img_info['filename']})\n\n")
                             # Continue table if there are more rows
                             if row_num < sorted_rows[-1]:
-                                md_lines.append("| " + " | ".join(all_cols) + " |")
-                                md_lines.append("|" + "|".join(["---"] * len(all_cols)) + "|")
+                                write(table_header)
                         
                         last_row = row_num
                     
@@ -640,14 +838,11 @@ class ExcelExtractor:
                     max_row = sorted_rows[-1] if sorted_rows else 0
                     for check_row in range(max_row + 1, max(image_by_row.keys()) + 1 if image_by_row else max_row + 1):
                         if check_row in image_by_row:
-                            md_lines.append("")
+                            write("\n")
                             for img_info in image_by_row[check_row]:
-                                md_lines.append(f"**Image at {img_info['position_text']}:**")
-                                md_lines.append("")
-                                md_lines.append(f"![Image]({img_info['filename']})")
-                                md_lines.append("")
+                                write(f"**Image at {img_info['position_text']}:**\n\n![Image]({img_info['filename']})\n\n")
                     
-                    md_lines.append("")
+                    write("\n")
             elif images:
                 # No cell data, but there are images
                 for img in images:
@@ -658,42 +853,69 @@ class ExcelExtractor:
                         col_letter_to = get_column_letter(to_col + 1)
                         row_from = from_row + 1
                         row_to = to_row + 1
-                        md_lines.append(f"**Image at {col_letter_from}{row_from} to {col_letter_to}{row_to}:**")
-                    md_lines.append("")
-                    md_lines.append(f"![Image]({img['filename']})")
-                    md_lines.append("")
+                        write(f"**Image at {col_letter_from}{row_from} to {col_letter_to}{row_to}:**\n")
+                    write(f"\n![Image]({img['filename']})\n\n")
             
             # Hyperlinks (if any)
             hyperlinks = sheet_data.get("hyperlinks", {})
             if hyperlinks:
-                md_lines.append("### Hyperlinks")
-                md_lines.append("")
+                write("### Hyperlinks\n")
+                write("\n")
                 for cell_ref, link_data in hyperlinks.items():
                     display = link_data.get('display', '')
                     url = link_data.get('url', '')
-                    md_lines.append(f"- **{cell_ref}**: [{display}]({url})")
-                md_lines.append("")
+                    write(f"- **{cell_ref}**: [{display}]({url})\n")
+                write("\n")
             
             # Comments (if any)
             comments = sheet_data.get("comments", {})
             if comments:
-                md_lines.append("### Comments")
-                md_lines.append("")
+                write("### Comments\n")
+                write("\n")
                 for cell_ref, comment_data in comments.items():
                     author = comment_data.get('author', '')
-                    text = comment_data.get('text', '').replace("\n", " ")
-                    md_lines.append(f"- **{cell_ref}** ({author}): {text}")
-                md_lines.append("")
-        
-        markdown_content = "\n".join(md_lines)
-        
-        # Save to file
-        output_path = os.path.join(self.output_dir, output_filename)
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(markdown_content)
-        
-        print(f"\nMarkdown report saved to: {output_path}")
-        return markdown_content
+                    text = comment_data.get('text', '').translate(COMMENT_TEXT_ESCAPES)
+                    write(f"- **{cell_ref}** ({author}): {text}\n")
+                write("\n")
+
+
+# Read-only extractor opened once per worker process by _init_extract_worker
+_worker_extractor = None
+
+
+def _init_extract_worker(excel_path: str, output_dir: str, with_images: bool = False):
+    """Load the workbook once in each worker process"""
+    global _worker_extractor
+    _worker_extractor = ExcelExtractor(excel_path, output_dir, read_only=True)
+    _worker_extractor.load_excel()
+    
+    if not with_images:
+        # The parent extracts the images, workers only read cells
+        _worker_extractor._image_index = {}
+
+
+def _extract_sheet_in_worker(sheet_name: str) -> Dict[str, Any]:
+    """Extract a sheet with the worker's own workbook"""
+    return _worker_extractor.extract_worksheet(_worker_extractor.workbook[sheet_name])
+
+
+def _extract_sheet_to_files(extractor: ExcelExtractor, sheet_name: str):
+    """Extract a sheet and save its JSON data and Markdown report"""
+    extractor.extract_single_sheet(sheet_name)
+    safe_name = make_safe_filename(sheet_name)
+    
+    # Save to JSON
+    json_filename = f"extracted_data_{safe_name}.json"
+    extractor.save_to_json(json_filename)
+    
+    # Generate Markdown
+    md_filename = f"extracted_content_{safe_name}.md"
+    extractor.generate_markdown(md_filename)
+
+
+def _extract_sheet_to_files_in_worker(sheet_name: str):
+    """Extract a sheet to its files with the worker's own workbook"""
+    _extract_sheet_to_files(_worker_extractor, sheet_name)
 
 
 def main():
@@ -707,6 +929,10 @@ def main():
     parser.add_argument('--sheet', '-s', help='Extract only the specified sheet')
     parser.add_argument('--list-sheets', '-l', action='store_true', help='List all sheets and exit')
     parser.add_argument('--output-dir', '-o', help='Output directory (default: extracted_content)')
+    parser.add_argument('--read-only', '-r', action='store_true',
+                        help='Extract cell values only, faster on large files (no styles, merged cells, hyperlinks, comments or charts)')
+    parser.add_argument('--no-styles', action='store_true',
+                        help='Skip cell styles, cells holding only formatting are left out')
     
     args = parser.parse_args()
     
@@ -714,9 +940,10 @@ def main():
     excel_file = args.excel_file
     if not excel_file:
         # Default: look for any Excel file in current directory
-        excel_files = list(Path('.').glob('*.xlsx')) + list(Path('.').glob('*.xlsm'))
-        if excel_files:
-            excel_file = str(excel_files[0])
+        # Stop at the first match instead of listing the directory twice
+        excel_file = next(chain(Path('.').glob('*.xlsx'), Path('.').glob('*.xlsm')), None)
+        if excel_file:
+            excel_file = str(excel_file)
             print(f"No file specified, using: {excel_file}")
         else:
             print("Usage: python test_openpyxl.py <excel_file.xlsx> [--sheet SHEET_NAME]")
@@ -724,6 +951,8 @@ def main():
             print("  --sheet, -s SHEET_NAME    Extract only the specified sheet")
             print("  --list-sheets, -l         List all sheets in the workbook")
             print("  --output-dir, -o DIR      Specify output directory")
+            print("  --read-only, -r           Extract cell values only, faster on large files")
+            print("  --no-styles               Skip cell styles")
             print("\nExamples:")
             print("  python test_openpyxl.py data.xlsx")
             print("  python test_openpyxl.py data.xlsx --sheet Sheet1")
@@ -738,7 +967,9 @@ def main():
     output_dir = args.output_dir or "extracted_content"
     
     # Create extractor
-    extractor = ExcelExtractor(excel_file, output_dir=output_dir)
+    extractor = ExcelExtractor(
+        excel_file, output_dir=output_dir, read_only=args.read_only, extract_styles=not args.no_styles
+    )
     
     try:
         # List sheets mode
@@ -755,7 +986,7 @@ def main():
             # Extract single sheet
             try:
                 extractor.extract_single_sheet(args.sheet)
-                output_suffix = f"_{args.sheet}"
+                output_suffix = f"_{make_safe_filename(args.sheet)}"
                 
                 # Save to JSON
                 json_filename = f"extracted_data{output_suffix}.json"
@@ -783,26 +1014,33 @@ def main():
             sheets = extractor.list_sheets()
             total_sheets = len(sheets)
             
-            for idx, sheet_name in enumerate(sheets, 1):
-                print(f"\n[{idx}/{total_sheets}] Processing sheet: {sheet_name}")
-                
-                try:
-                    # Extract this sheet
-                    extractor.extract_single_sheet(sheet_name)
+            # As in extract_all, only read-only workbooks are cheap enough to
+            # open again in every worker process
+            max_workers = min(os.cpu_count() or 1, total_sheets)
+            if extractor.read_only and max_workers > 1:
+                with ProcessPoolExecutor(
+                    max_workers=max_workers,
+                    initializer=_init_extract_worker,
+                    initargs=(excel_file, output_dir, True)
+                ) as executor:
+                    futures = [executor.submit(_extract_sheet_to_files_in_worker, sheet_name) for sheet_name in sheets]
+                    for idx, (sheet_name, future) in enumerate(zip(sheets, futures), 1):
+                        try:
+                            future.result()
+                            print(f"✓ [{idx}/{total_sheets}] Completed: {sheet_name}")
+                        except Exception as e:
+                            print(f"✗ Error processing sheet '{sheet_name}': {e}")
+            else:
+                for idx, sheet_name in enumerate(sheets, 1):
+                    print(f"\n[{idx}/{total_sheets}] Processing sheet: {sheet_name}")
                     
-                    # Save to JSON
-                    json_filename = f"extracted_data_{sheet_name}.json"
-                    extractor.save_to_json(json_filename)
-                    
-                    # Generate Markdown
-                    md_filename = f"extracted_content_{sheet_name}.md"
-                    extractor.generate_markdown(md_filename)
-                    
-                    print(f"✓ Completed: {sheet_name}")
-                    
-                except Exception as e:
-                    print(f"✗ Error processing sheet '{sheet_name}': {e}")
-                    continue
+                    try:
+                        _extract_sheet_to_files(extractor, sheet_name)
+                        print(f"✓ Completed: {sheet_name}")
+                        
+                    except Exception as e:
+                        print(f"✗ Error processing sheet '{sheet_name}': {e}")
+                        continue
             
             # Generate overall summary
             print("\n" + "="*60)
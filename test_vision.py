@@ -1,10 +1,42 @@
 import os
+import mmap
 import base64
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from openai import AzureOpenAI
 from typing import Optional
 import json
 
+# Leading bytes of the image formats the vision models accept
+IMAGE_SIGNATURES = (
+    (b'\x89PNG\r\n\x1a\n', 'image/png'),
+    (b'\xff\xd8\xff', 'image/jpeg'),
+    (b'GIF87a', 'image/gif'),
+    (b'GIF89a', 'image/gif'),
+)
+
+
+def detect_image_mime_type(image_path: str) -> str:
+    """
+    Detect the MIME type of an image from its leading bytes
+    
+    Args:
+        image_path: Path to the image file
+        
+    Returns:
+        MIME type of the image, image/jpeg when the format is not recognised
+    """
+    with open(image_path, "rb") as image_file:
+        header = image_file.read(12)
+    
+    for signature, mime_type in IMAGE_SIGNATURES:
+        if header.startswith(signature):
+            return mime_type
+    # WebP is a RIFF container naming its format after the size field
+    if header[:4] == b'RIFF' and header[8:12] == b'WEBP':
+        return 'image/webp'
+    return 'image/jpeg'
+
 
 class VisionModelTester:
     """Test Azure OpenAI vision models with image inputs"""
@@ -34,7 +66,43 @@ class VisionModelTester:
             Base64 encoded image string
         """
         with open(image_path, "rb") as image_file:
-            return base64.b64encode(image_file.read()).decode('utf-8')
+            # Empty files cannot be mapped, and encode to nothing
+            if os.fstat(image_file.fileno()).st_size == 0:
+                return ""
+            
+            # Encode straight from the mapped file instead of reading a copy first
+            with mmap.mmap(image_file.fileno(), 0, access=mmap.ACCESS_READ) as image_data:
+                return base64.b64encode(image_data).decode('ascii')
+    
+    def prepare_image_content(self, image_path: str, use_url: bool = False) -> dict:
+        """
+        Build the image part of a chat message
+        
+        Args:
+            image_path: Path to the image file or URL
+            use_url: Whether the image_path is a URL, http(s) paths always are
+            
+        Returns:
+            Image content dictionary for the messages
+        """
+        # Hosted images are fetched by the service, no need to encode them
+        if use_url or image_path.startswith(("http://", "https://")):
+            return {
+                "type": "image_url",
+                "image_url": {
+                    "url": image_path
+                }
+            }
+        
+        # Encode local image to base64, labelled with its actual format
+        mime_type = detect_image_mime_type(image_path)
+        base64_image = self.encode_image(image_path)
+        return {
+            "type": "image_url",
+            "image_url": {
+                "url": f"data:{mime_type};base64,{base64_image}"
+            }
+        }
     
     def test_vision_model(
         self,
@@ -43,7 +111,9 @@ class VisionModelTester:
         prompt: str = "What do you see in this image? Please describe it in detail.",
         use_url: bool = False,
         temperature: float = 0.7,
-        reasoning_effort: str = "medium"  # For GPT-5: low, medium, high
+        reasoning_effort: str = "medium",  # For GPT-5: low, medium, high
+        image_content: Optional[dict] = None,
+        verbose: bool = True
     ) -> dict:
         """
         Test a vision model with an image input
@@ -56,6 +126,9 @@ class VisionModelTester:
             temperature: Temperature parameter for generation (not supported by GPT-5)
             max_tokens: Maximum tokens to generate
             reasoning_effort: Reasoning effort for GPT-5 (low, medium, high)
+            image_content: Image content from prepare_image_content, saves
+                encoding the same image again for every call
+            verbose: Print the call and its response as it runs
             
         Returns:
             Dictionary containing the response and metadata
@@ -66,22 +139,8 @@ class VisionModelTester:
         deployment_name = self.models[model_name]
         
         # Prepare image content
-        if use_url:
-            image_content = {
-                "type": "image_url",
-                "image_url": {
-                    "url": image_path
-                }
-            }
-        else:
-            # Encode local image to base64
-            base64_image = self.encode_image(image_path)
-            image_content = {
-                "type": "image_url",
-                "image_url": {
-                    "url": f"data:image/jpeg;base64,{base64_image}"
-                }
-            }
+        if image_content is None:
+            image_content = self.prepare_image_content(image_path, use_url)
         
         # Create messages
         messages = [
@@ -97,11 +156,8 @@ class VisionModelTester:
             }
         ]
         
-        print(f"\n{'='*60}")
-        print(f"Testing model: {model_name} (deployment: {deployment_name})")
-        print(f"Image: {image_path}")
-        print(f"Prompt: {prompt}")
-        print(f"{'='*60}\n")
+        if verbose:
+            self.print_call_header(model_name, deployment_name, image_path, prompt)
         
         try:
             # Prepare API call parameters based on model
@@ -147,20 +203,35 @@ class VisionModelTester:
                 "finish_reason": response.choices[0].finish_reason
             }
             
-            print(f"Response:\n{result['response']}\n")
-            print(f"Token usage: {result['usage']}\n")
-            
-            return result
-            
         except Exception as e:
-            print(f"Error testing {model_name}: {str(e)}\n")
-            return {
+            result = {
                 "model": model_name,
                 "deployment": deployment_name,
                 "image_path": image_path,
                 "prompt": prompt,
                 "error": str(e)
             }
+        
+        if verbose:
+            self.print_call_outcome(result)
+        
+        return result
+    
+    def print_call_header(self, model_name: str, deployment_name: str, image_path: str, prompt: str):
+        """Print which model, image and prompt a call tests"""
+        print(f"\n{'='*60}")
+        print(f"Testing model: {model_name} (deployment: {deployment_name})")
+        print(f"Image: {image_path}")
+        print(f"Prompt: {prompt}")
+        print(f"{'='*60}\n")
+    
+    def print_call_outcome(self, result: dict):
+        """Print the response or error of a test_vision_model result"""
+        if "error" in result:
+            print(f"Error testing {result['model']}: {result['error']}\n")
+        else:
+            print(f"Response:\n{result['response']}\n")
+            print(f"Token usage: {result['usage']}\n")
     
     def compare_models(
         self,
@@ -169,7 +240,8 @@ class VisionModelTester:
         use_url: bool = False,
         save_results: bool = True,
         output_file: str = "vision_test_results.json",
-        reasoning_effort: str = "medium"
+        reasoning_effort: str = "medium",
+        max_concurrency: int = 4
     ) -> list[dict]:
         """
         Compare multiple models with different prompts
@@ -182,31 +254,54 @@ class VisionModelTester:
             output_file: Output file name for results
             max_tokens: Maximum tokens for each response
             reasoning_effort: Reasoning effort for GPT-5 (low, medium, high)
+            max_concurrency: Maximum number of API calls in flight at once
             
         Returns:
-            List of result dictionaries
+            List of result dictionaries, ordered by prompt then model
         """
-        all_results = []
+        calls = [(prompt, model_name) for prompt in prompts for model_name in self.models]
+        
+        # Every call sends the same image, encode it once
+        image_content = self.prepare_image_content(image_path, use_url)
+        
+        print(f"\nTesting {len(prompts)} prompt(s) on {len(self.models)} model(s)...")
+        
+        def run_call(call: tuple[str, str]) -> dict:
+            prompt, model_name = call
+            return self.test_vision_model(
+                model_name=model_name,
+                image_path=image_path,
+                prompt=prompt,
+                use_url=use_url,
+                reasoning_effort=reasoning_effort,
+                image_content=image_content,
+                verbose=False
+            )
+        
+        # The calls spend their time waiting on the API, so run them side by
+        # side. The client is thread-safe and shares its connection pool
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            all_results = list(executor.map(run_call, calls))
         
-        for prompt in prompts:
+        # Print the results in prompt then model order, output from the
+        # threads themselves would interleave
+        results_per_prompt = len(self.models)
+        for prompt_idx, prompt in enumerate(prompts):
             print(f"\n{'#'*60}")
             print(f"Testing with prompt: {prompt}")
             print(f"{'#'*60}")
             
-            for model_name in self.models.keys():
-                result = self.test_vision_model(
-                    model_name=model_name,
-                    image_path=image_path,
-                    prompt=prompt,
-                    use_url=use_url,
-                    reasoning_effort=reasoning_effort
-                )
-                all_results.append(result)
+            start = prompt_idx * results_per_prompt
+            for result in all_results[start:start + results_per_prompt]:
+                self.print_call_header(result["model"], result["deployment"], result["image_path"], prompt)
+                self.print_call_outcome(result)
         
         if save_results:
             output_path = Path(output_file)
+            # Encode in one go and write once, json.dump issues a write per token
+            output = json.dumps(all_results, indent=2, ensure_ascii=False)
             with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(all_results, f, indent=2, ensure_ascii=False)
+                f.write(output)
             print(f"\nResults saved to: {output_path.absolute()}")
         
         return all_results
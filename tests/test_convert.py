@@ -0,0 +1,144 @@
+"""
+Tests for the sheet cleaning and markdown rendering of the converters
+"""
+
+import shutil
+
+import pytest
+from openpyxl import Workbook
+
+from excel_clean import clean_rows
+from excel_sheets import iter_converted_sheets
+
+CLEAN_MODES = ['none', 'minimal', 'auto', 'aggressive']
+
+TABLE = (
+    "| Name | Note | Amount |\n"
+    "|---|---|---|\n"
+    "| a\\|b | first second | 3 |\n"
+    "| c |  | 2.5 |"
+)
+
+OFFSET_CLEANED = (
+    "| Key | Value |\n"
+    "|---|---|\n"
+    "| x | 1 |\n"
+    "| y | 2 |"
+)
+
+
+def make_workbook(path):
+    """Write a workbook with a plain table, a blank sheet, an offset table and a sparse table"""
+    workbook = Workbook()
+    table = workbook.active
+    table.title = "Table"
+    table.append(["Name", "Note", "Amount"])
+    table.append(["a|b", "first\nsecond", 3.0])
+    table.append(["c", None, 2.5])
+    
+    workbook.create_sheet("Blank")
+    
+    # Data starts at C3, with an empty row inside it
+    offset = workbook.create_sheet("Offset")
+    offset["C3"] = "Key"
+    offset["D3"] = "Value"
+    offset["C4"] = "x"
+    offset["D4"] = 1.0
+    offset["C6"] = "y"
+    offset["D6"] = 2
+    
+    sparse = workbook.create_sheet("Sparse")
+    sparse.append(["h1", "h2", "h3", "h4"])
+    sparse.append(["v1", "v2", "v3", "v4"])
+    sparse.append(["only", None, None, None])
+    sparse.append(["w1", "w2", "w3", None])
+    
+    workbook.save(path)
+
+
+def convert(path, clean_mode):
+    """Convert every sheet in this process, keyed by sheet name"""
+    return dict(iter_converted_sheets(path, clean_mode, max_workers=1))
+
+
+@pytest.mark.parametrize("clean_mode", CLEAN_MODES)
+def test_sheets_come_back_in_order_with_blank_sheets_as_none(tmp_path, clean_mode):
+    excel_path = tmp_path / "sheets.xlsx"
+    make_workbook(excel_path)
+    
+    sheets = convert(excel_path, clean_mode)
+    
+    assert list(sheets) == ["Table", "Blank", "Offset", "Sparse"]
+    assert sheets["Blank"] is None
+
+
+@pytest.mark.parametrize("clean_mode", CLEAN_MODES)
+def test_cells_are_escaped_and_whole_numbers_shown_as_ints(tmp_path, clean_mode):
+    excel_path = tmp_path / "sheets.xlsx"
+    make_workbook(excel_path)
+    
+    assert convert(excel_path, clean_mode)["Table"] == TABLE
+
+
+@pytest.mark.parametrize("clean_mode", ['minimal', 'auto', 'aggressive'])
+def test_cleaning_trims_empty_rows_and_columns_around_the_data(tmp_path, clean_mode):
+    excel_path = tmp_path / "sheets.xlsx"
+    make_workbook(excel_path)
+    
+    assert convert(excel_path, clean_mode)["Offset"] == OFFSET_CLEANED
+
+
+def test_none_mode_keeps_the_sheet_from_a1(tmp_path):
+    excel_path = tmp_path / "sheets.xlsx"
+    make_workbook(excel_path)
+    
+    assert convert(excel_path, 'none')["Offset"] == (
+        "|  |  |  |  |\n"
+        "|---|---|---|---|\n"
+        "|  |  |  |  |\n"
+        "|  |  | Key | Value |\n"
+        "|  |  | x | 1 |\n"
+        "|  |  |  |  |\n"
+        "|  |  | y | 2 |"
+    )
+
+
+@pytest.mark.parametrize("clean_mode, kept_sparse_row", [
+    ('none', True),
+    ('minimal', True),
+    ('auto', True),
+    ('aggressive', False),
+])
+def test_only_aggressive_mode_drops_sparse_rows(tmp_path, clean_mode, kept_sparse_row):
+    excel_path = tmp_path / "sheets.xlsx"
+    make_workbook(excel_path)
+    
+    markdown = convert(excel_path, clean_mode)["Sparse"]
+    
+    assert ("| only |  |  |  |" in markdown) == kept_sparse_row
+    assert "| w1 | w2 | w3 |  |" in markdown
+
+
+@pytest.mark.parametrize("clean_mode", ['minimal', 'auto'])
+def test_clean_rows_drops_leading_and_trailing_empty_rows_and_columns(clean_mode):
+    rows = [
+        ['', None, '', ''],
+        ['', 'a', 'b', None],
+        [None, 'c', '', ''],
+        ['', '', None, ''],
+    ]
+    
+    assert clean_rows(rows, mode=clean_mode) == [['a', 'b'], ['c', '']]
+    assert clean_rows(rows, mode='none') is rows
+
+
+@pytest.mark.parametrize("clean_mode", CLEAN_MODES)
+def test_calamine_rows_match_the_pandas_fallback(tmp_path, clean_mode):
+    pytest.importorskip("pandas")
+    excel_path = tmp_path / "sheets.xlsx"
+    make_workbook(excel_path)
+    # Macro-enabled workbooks are read through pandas and clean_dataframe
+    macro_path = tmp_path / "sheets.xlsm"
+    shutil.copy(excel_path, macro_path)
+    
+    assert convert(excel_path, clean_mode) == convert(macro_path, clean_mode)
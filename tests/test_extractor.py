@@ -0,0 +1,71 @@
+"""
+Tests for the openpyxl content extractor
+"""
+
+from openpyxl import Workbook
+from openpyxl.comments import Comment
+
+from test_openpyxl import ExcelExtractor
+
+
+def make_workbook(path):
+    """Write a small workbook with a merged range, a hyperlink and a comment"""
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.title = "Data"
+    sheet["A1"] = "Title"
+    sheet.merge_cells("A1:C1")
+    sheet["A2"] = "Link"
+    sheet["A2"].hyperlink = "https://example.com"
+    sheet["B2"] = 42
+    sheet["B2"].comment = Comment("checked\ntwice", "reviewer")
+    workbook.save(path)
+
+
+def test_extract_sheet_with_merged_range_and_hyperlink(tmp_path):
+    excel_path = tmp_path / "merged.xlsx"
+    make_workbook(excel_path)
+    
+    extractor = ExcelExtractor(str(excel_path), output_dir=str(tmp_path / "out"))
+    sheet_data = extractor.extract_all(max_workers=1)["sheets"]["Data"]
+    
+    assert sheet_data["merged_cells"] == ["A1:C1"]
+    assert sheet_data["hyperlinks"] == {
+        "A2": {"url": "https://example.com", "display": "Link", "tooltip": None},
+    }
+    assert sheet_data["comments"] == {"B2": {"text": "checked\ntwice", "author": "reviewer"}}
+    assert sheet_data["cells"]["A1"]["data"]["value"] == "Title"
+    assert sheet_data["cells"]["B2"]["data"]["value"] == 42
+
+
+def test_hyperlink_and_comment_helpers_match_the_cell_scan(tmp_path):
+    excel_path = tmp_path / "merged.xlsx"
+    make_workbook(excel_path)
+    
+    extractor = ExcelExtractor(str(excel_path), output_dir=str(tmp_path / "out"))
+    extractor.load_excel()
+    worksheet = extractor.workbook["Data"]
+    _, hyperlinks, comments = extractor._scan_cells(worksheet)
+    
+    assert extractor.extract_hyperlinks(worksheet) == hyperlinks
+    assert extractor.extract_comments(worksheet) == comments
+
+
+def test_markdown_table_escapes_cells_like_the_converters(tmp_path):
+    excel_path = tmp_path / "text.xlsx"
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.title = "Text"
+    sheet["A1"] = "placeholder"
+    sheet["B1"] = "plain"
+    workbook.save(excel_path)
+    
+    extractor = ExcelExtractor(str(excel_path), output_dir=str(tmp_path / "out"))
+    data = extractor.extract_all(max_workers=1)
+    # The XML parser turns a stored CR into LF, set the cell text afterwards
+    data["sheets"]["Text"]["cells"]["A1"]["data"]["value"] = "first\r\nsecond|third"
+    with open(extractor.generate_markdown(), encoding='utf-8', newline='') as f:
+        report = f.read()
+    
+    assert "| first second\\|third | plain |\n" in report
+    assert "\r" not in report